@@ -1,8 +1,9 @@
 import sys
-from gitmuse.cli.cli_core import run_cli, run_commit
 
 
 def main():
+    from gitmuse.cli.cli_core import run_cli, run_commit
+
     if len(sys.argv) == 1:
         run_commit()
     else:
@@ -1,33 +1,45 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 import click
 from rich.console import Console
 from gitmuse.config.settings import CONFIG
-from gitmuse.providers.ollama import OllamaProvider
 from gitmuse.__version__ import __version__
 from gitmuse.cli.banner import GITMUSE_BANNER
-from gitmuse.cli.commands import commit_command
 
 console = Console()
 
+
+def print_banner() -> None:
+    console.print(GITMUSE_BANNER, style="bold cyan")
+    console.print(f"GitMuse v{__version__}", style="italic green")
+    console.print("AI-powered Git commit message generator", style="italic")
+
+
 @click.group(invoke_without_command=True)
 @click.pass_context
 @click.option('--version', is_flag=True, help="Show the version and exit.")
 def cli(ctx, version):
     """GitMuse CLI"""
+    if version or ctx.invoked_subcommand is None:
+        print_banner()
     if version:
-        console.print(GITMUSE_BANNER, style="bold cyan")
-        console.print(f"GitMuse v{__version__}", style="italic green")
-        console.print("AI-powered Git commit message generator", style="italic")
         ctx.exit()
-    elif ctx.invoked_subcommand is None:
-        console.print(GITMUSE_BANNER, style="bold cyan")
-        console.print(f"GitMuse v{__version__}", style="italic green")
-        console.print("AI-powered Git commit message generator", style="italic")
 
 @cli.command()
-def commit():
+@click.option(
+    "--force-full-diff",
+    is_flag=True,
+    help="Send the full diff even for very large changesets.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ask the AI provider for a fresh message instead of reusing a cached one.",
+)
+def commit(force_full_diff, no_cache):
     """Generate and apply a commit message"""
-    run_commit()
+    run_commit(force_full_diff=force_full_diff, use_cache=not no_cache)
 
 cli.add_command(commit)
 
@@ -43,25 +55,40 @@ def init(is_global):
     else:
         CONFIG.init_config()
 
-def run_commit() -> None:
+def run_commit(
+    provider: Optional[str] = None, force_full_diff: bool = False, use_cache: bool = True
+) -> None:
     """
     Run the commit command based on the specified provider.
-    Checks the provider environment variable and raises errors if the provider is unsupported,
+    Falls back to the PROVIDER environment variable and the configuration file when no
+    provider is given, and raises errors if the provider is unsupported,
     API key is missing for OpenAI, or Ollama is not accessible.
     """
     try:
-        provider = os.getenv("PROVIDER", CONFIG.get_ai_provider())
+        from gitmuse.cli.commands import commit_command, get_provider_context
+
+        context = get_provider_context(provider)
+        provider = context.provider
 
         # Validate the provider and check required configurations
         if provider == "openai":
-            openai_api_key = os.getenv("OPENAI_API_KEY") or CONFIG.get_openai_api_key()
-            if not openai_api_key:
+            if not context.openai_api_key:
                 raise RuntimeError(
                     "OpenAI API key not found. Please set the OPENAI_API_KEY environment variable or in the configuration file."
                 )
             # No need to configure OpenAIProvider here
         elif provider == "ollama":
-            if not OllamaProvider.check_ollama():
+            from gitmuse.core.git_utils import get_gitignore_patterns
+            from gitmuse.providers.ollama import OllamaProvider
+
+            # Warm the cached git probes commit_command needs while the
+            # Ollama health check is waiting on the network. The gitignore
+            # patterns are read for the staged files, so this loads both.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(get_gitignore_patterns)
+                ollama_available = OllamaProvider.check_ollama()
+
+            if not ollama_available:
                 raise RuntimeError(
                     "Ollama is not running or not accessible. Please start Ollama and try again."
                 )
@@ -69,7 +96,7 @@ def run_commit() -> None:
             raise ValueError(f"Unsupported provider: {provider}")
 
         # Call the commit command with the provider
-        commit_command(provider)
+        commit_command(provider, force_full_diff=force_full_diff, use_cache=use_cache)
 
     except (RuntimeError, ValueError) as e:
         console.print(f":x: [bold red]Error:[/bold red] {e}")
@@ -1,14 +1,20 @@
-from typing import Set, List, Tuple
-from rich.panel import Panel
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from typing import List, Optional, Tuple
 from rich.console import Console
+from rich.panel import Panel
 from rich.prompt import Prompt
 from gitmuse.core.git_utils import (
     check_staging_area,
     get_gitignore_patterns,
+    get_ignore_matcher,
     get_staged_files,
-    get_diff,
-    should_ignore,
-
+    get_diff_batch,
+    get_diffs,
+    get_diff_stat,
+    get_ignored_files,
+    IgnoreMatcher,
 )
 from gitmuse.cli.ui import (
     display_changes,
@@ -17,38 +23,99 @@ from gitmuse.cli.ui import (
     perform_commit,
     display_ai_model_info,
 )
-from gitmuse.models import StagedFile, IgnoredFile
-from gitmuse.utils.logging import get_logger
+from gitmuse.models import DiffStat, StagedFile, IgnoredFile, ProviderContext
+from gitmuse.utils.logging import defer_console_logs, get_logger
 from gitmuse.config.settings import CONFIG, ConfigError
-from gitmuse.core.message_generator import generate_commit_message
 
 logger = get_logger(__name__)
 console = Console()
 
+SUPPORTED_PROVIDERS = ("openai", "ollama")
+
+GENERATED_MESSAGE_TITLE = "Generated commit message"
+FINAL_MESSAGE_TITLE = "Final commit message"
+ACTION_PROMPT = ":question: Do you want to (e)dit, (c)ommit or (a)bort?"
+
+# Above these sizes only a per-file summary is sent instead of the full diff
+LARGE_DIFF_MAX_FILES = 50
+LARGE_DIFF_MAX_LINES = 20000
+
+# Header lines analyze_diff uses to classify a file when its diff is skipped
+SUMMARY_STATUS_LINES = {"A": "new file mode", "R": "rename from"}
+
+
+def is_large_diff(diff_stat: DiffStat) -> bool:
+    return (
+        diff_stat.files_changed > LARGE_DIFF_MAX_FILES
+        or diff_stat.insertions + diff_stat.deletions > LARGE_DIFF_MAX_LINES
+    )
+
+
+def get_file_summary(file: StagedFile) -> str:
+    status_line = SUMMARY_STATUS_LINES.get(file.status[0], "index")
+    old_path = file.file_path.partition("\t")[0]
+    return f"diff --git a/{old_path} b/{file.current_path}\n{status_line}\n"
+
 
 def get_commit_files(
-    staged_files: List[StagedFile], ignore_patterns: Set[str]
+    staged_files: List[StagedFile],
+    ignore_matcher: IgnoreMatcher,
+    full_diff: bool = True,
 ) -> Tuple[List[StagedFile], List[IgnoredFile], str]:
-    diff_content = ""
+    diff_parts: List[str] = []
     ignored_files: List[IgnoredFile] = []
     files_to_commit: List[StagedFile] = []
+    diff_map = get_diff_batch() if full_diff else {}
+    ignored_paths = get_ignored_files(
+        [file.current_path for file in staged_files], ignore_matcher
+    )
+    if full_diff:
+        # Fall back to per-file diffs for anything the batch output missed
+        missing_paths = [
+            file.current_path
+            for file in staged_files
+            if file.status[0] != "D"
+            and file.current_path not in ignored_paths
+            and file.current_path not in diff_map
+        ]
+        if missing_paths:
+            diff_map.update(get_diffs(missing_paths))
 
     for file in staged_files:
-        if should_ignore(file.file_path, ignore_patterns, staged_files):
+        if file.current_path in ignored_paths:
             ignored_files.append(IgnoredFile(file_path=file.file_path))
         elif file.status[0] != "D":
-            file_diff = get_diff(file.file_path)
+            file_diff = (
+                diff_map.get(file.current_path, "")
+                if full_diff
+                else get_file_summary(file)
+            )
             if file_diff:
-                diff_content += (
+                diff_parts.append(
                     f"File: {file.file_path}\nStatus: {file.status}\n{file_diff}\n\n"
                 )
                 files_to_commit.append(file)
         else:
             files_to_commit.append(file)
 
-    return files_to_commit, ignored_files, diff_content
+    return files_to_commit, ignored_files, "".join(diff_parts)
+
+
+@cache
+def get_default_provider() -> str:
+    return os.getenv("PROVIDER") or CONFIG.get_ai_provider() or "ollama"
+
 
+@lru_cache(maxsize=4)
+def get_provider_context(provider: Optional[str] = None) -> ProviderContext:
+    provider = provider or get_default_provider()
+    openai_api_key = ""
+    if provider == "openai":
+        openai_api_key = os.getenv("OPENAI_API_KEY") or CONFIG.get_openai_api_key()
+    return ProviderContext(provider=provider, openai_api_key=openai_api_key)
 
+
+@lru_cache(maxsize=1)
 def get_commit_message_config() -> Tuple[bool, str]:
     try:
         use_default_template = CONFIG.get_nested_config(
@@ -66,7 +133,9 @@ def get_commit_message_config() -> Tuple[bool, str]:
         return True, ""
 
 
-def commit_command(provider: str = "") -> None:
+def commit_command(
+    provider: str = "", force_full_diff: bool = False, use_cache: bool = True
+) -> None:
     try:
         # Check for changes in the staging area
         if not check_staging_area():
@@ -76,8 +145,12 @@ def commit_command(provider: str = "") -> None:
             )
             return
 
+        # Pulls in the providers and their HTTP clients, so only once there
+        # is something to commit
+        from gitmuse.core.message_generator import generate_commit_message
+
         # Get the staged files and ignore patterns
-        ignore_patterns: Set[str] = get_gitignore_patterns()
+        ignore_matcher = get_ignore_matcher(frozenset(get_gitignore_patterns()))
         staged_files: List[StagedFile] = get_staged_files()
 
         if not staged_files:
@@ -85,16 +158,27 @@ def commit_command(provider: str = "") -> None:
             console.print("[bold yellow]No changes to commit.[/bold yellow]")
             return
 
-        # Display changes and diff to the user
+        # Skip the full diff for very large changesets unless asked for it
+        diff_stat = get_diff_stat()
+        full_diff = force_full_diff or not is_large_diff(diff_stat)
+        if not full_diff:
+            logger.warning("Large changeset, using a file summary instead of the full diff.")
+            console.print(
+                f"[bold yellow]Large changeset ({diff_stat.files_changed} files, "
+                f"{diff_stat.insertions + diff_stat.deletions} lines changed): "
+                "summarizing files instead of sending the full diff. "
+                "Use --force-full-diff to send it anyway.[/bold yellow]"
+            )
+
+        # Display changes to the user
         files_to_commit, ignored_files, diff_content = get_commit_files(
-            staged_files, ignore_patterns
+            staged_files, ignore_matcher, full_diff=full_diff
         )
         display_changes(files_to_commit, ignored_files)
-        display_diff(diff_content)
 
         # Validate the provider and display AI model info
-        provider = provider or CONFIG.get_ai_provider() or "ollama"
-        if provider not in ["openai", "ollama"]:
+        provider = provider or get_default_provider()
+        if provider not in SUPPORTED_PROVIDERS:
             console.print(f":x: [bold red]Error:[/bold red] Unsupported AI provider: {provider}")
             return
         display_ai_model_info(provider)
@@ -102,43 +186,44 @@ def commit_command(provider: str = "") -> None:
         # Get commit message configuration
         use_default_template, custom_template = get_commit_message_config()
 
-        # Generate commit message
-        commit_msg: str = generate_commit_message(
-            diff_content,
-            provider=provider,
-            use_default_template=use_default_template,
-            custom_template=custom_template,
-        )
+        # Generate the commit message in the background while the user
+        # looks at the diff, so the provider round-trip overlaps with it.
+        # Its log output waits until the message is ready so it can't
+        # interleave with the prompt.
+        with defer_console_logs(), ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                generate_commit_message,
+                diff_content,
+                provider=provider,
+                use_default_template=use_default_template,
+                custom_template=custom_template,
+                show_progress=False,
+                use_cache=use_cache,
+            )
+            display_diff(diff_content)
+
+            if future.done():
+                commit_msg: str = future.result()
+            else:
+                with console.status("[cyan]Generating commit message..."):
+                    commit_msg = future.result()
 
         logger.info("Generated commit message")
-        console.print(Panel(commit_msg, title="Generated commit message", expand=False))
+        console.print(Panel.fit(commit_msg, title=GENERATED_MESSAGE_TITLE))
 
-        if (
-            Prompt.ask(
-                ":pencil2: Do you want to edit the commit message?",
-                choices=["y", "n"],
-                default="n",
-            )
-            == "y"
-        ):
+        # Editing loops back to the same question, committing needs no second confirmation
+        while (
+            action := Prompt.ask(ACTION_PROMPT, choices=["e", "c", "a"], default="c")
+        ) == "e":
             commit_msg = edit_commit_message(commit_msg)
             logger.info("Commit message edited by user")
+            console.print(Panel.fit(commit_msg, title=FINAL_MESSAGE_TITLE))
 
-        console.print(Panel(commit_msg, title="Final commit message", expand=False))
-
-        if (
-            Prompt.ask(
-                ":white_check_mark: Do you want to commit with this message?",
-                choices=["y", "n"],
-                default="y",
-            )
-            == "y"
-        ):
-            perform_commit(commit_msg)
-            logger.info("Commit successfully created")
-            console.print(
-                ":tada: [bold green]Commit successfully created.[/bold green]"
-            )
+        if action == "c":
+            if perform_commit(commit_msg, confirm=False):
+                console.print(
+                    ":tada: [bold green]Commit successfully created.[/bold green]"
+                )
         else:
             logger.info("Commit cancelled by user")
             console.print(
@@ -1,20 +1,35 @@
 from typing import List, Tuple, Dict
 from rich.console import Console
-from rich.syntax import Syntax
 from rich.panel import Panel
 from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-import tempfile
-import subprocess
 import os
+import sys
 from gitmuse.utils.logging import get_logger
 from gitmuse.config.settings import CONFIG, ConfigError
 from gitmuse.models import StagedFile, IgnoredFile
 
+__all__ = [
+    "display_table",
+    "display_changes",
+    "display_diff",
+    "edit_commit_message",
+    "perform_commit",
+    "display_ai_model_info",
+    "display_commit_message",
+]
+
 logger = get_logger(__name__)
 console = Console()
 
+# Without a terminal on stdin the prompts below just take their defaults
+_IS_TTY = sys.stdin.isatty()
+
+# Row of the changes table for each git status letter
+_STATUS_BUCKET = {"A": "Added", "M": "Modified", "D": "Deleted", "R": "Renamed"}
+# Rows of the changes table, in display order
+_CHANGE_KEYS = ("Added", "Modified", "Deleted", "Renamed", "Ignored")
+
 
 def display_table(
     title: str, columns: List[Tuple[str, str]], rows: List[List[str]]
@@ -36,45 +51,56 @@ def display_table(
 def display_changes(
     changes: List[StagedFile], ignored_files: List[IgnoredFile]
 ) -> None:
-    changes_dict: Dict[str, List[str]] = {
-        "Added": [],
-        "Modified": [],
-        "Deleted": [],
-        "Renamed": [],
-        "Ignored": [file.file_path for file in ignored_files],
-    }
+    changes_dict: Dict[str, List[str]] = {key: [] for key in _CHANGE_KEYS}
+    changes_dict["Ignored"] = [file.file_path for file in ignored_files]
 
     for file in changes:
-        if file.status.startswith('A'):
-            changes_dict["Added"].append(file.file_path)
-        elif file.status.startswith('M'):
-            changes_dict["Modified"].append(file.file_path)
-        elif file.status.startswith('D'):
-            changes_dict["Deleted"].append(file.file_path)
-        elif file.status.startswith('R'):
-            changes_dict["Renamed"].append(file.file_path)
+        bucket = _STATUS_BUCKET.get(file.status[:1])
+        if bucket:
+            changes_dict[bucket].append(file.file_path)
+
+    rows = [(status, files) for status, files in changes_dict.items() if files]
+    if not rows:
+        logger.debug("No changes to display")
+        return
 
     table = Table(title="Changes", title_justify="left", style="bold magenta")
     table.add_column("Status", style="cyan")
     table.add_column("Files", style="green")
 
-    for status, files in changes_dict.items():
-        if files:
-            table.add_row(status, "\n".join(files))
+    for status, files in rows:
+        table.add_row(status, "\n".join(files))
 
     console.print(table)
     logger.debug("Displayed changes table")
 
 
+def _head_lines(text: str, count: int) -> str:
+    """
+    Return the first count lines of text without splitting the rest of it.
+    """
+    end = -1
+    for _ in range(count):
+        end = text.find("\n", end + 1)
+        if end < 0:
+            return text
+    return text[:end]
+
+
 def display_diff(diff: str) -> None:
     """
     Ask the user how they would like to view the diff and display it accordingly.
     """
+    from rich.syntax import Syntax
 
-    view_option = Prompt.ask(
-        "How would you like to view the diff?",
-        choices=["full", "summary", "none"],
-        default="none",
+    view_option = (
+        Prompt.ask(
+            "How would you like to view the diff?",
+            choices=["full", "summary", "none"],
+            default="none",
+        )
+        if _IS_TTY
+        else "none"
     )
     if view_option == "none":
         console.print("[bold blue]Diff view skipped.[/bold blue]")
@@ -88,7 +114,7 @@ def display_diff(diff: str) -> None:
             "How many lines of diff do you want to see? (0 for all)", default=10
         )
     )
-    diff_preview = diff if max_lines == 0 else "\n".join(diff.splitlines()[:max_lines])
+    diff_preview = diff if max_lines == 0 else _head_lines(diff, max_lines)
     title = (
         "Full changes in staging area"
         if max_lines == 0
@@ -110,35 +136,48 @@ def edit_commit_message(initial_message: str) -> str:
     Open the default editor to allow the user to edit the commit message.
     The editor to use can be set via the EDITOR environment variable.
     """
+    import subprocess
+    import tempfile
+
+    fd, temp_path = tempfile.mkstemp(prefix="gitmuse-commit-", suffix=".txt")
     try:
-        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
+        with os.fdopen(fd, "w") as temp_file:
             temp_file.write(initial_message)
-            temp_file.flush()
-            editor = os.getenv("EDITOR", "nano")  
-            subprocess.run([editor, temp_file.name], check=True)
-            temp_file.seek(0)
+        # The file is closed before the editor opens it, and reread by name
+        # afterwards since many editors replace it rather than rewrite it
+        editor = os.getenv("EDITOR", "nano")
+        subprocess.run([editor, temp_path], check=True)
+        with open(temp_path) as temp_file:
             edited_message = temp_file.read()
         logger.info("Commit message edited by user")
         return edited_message.strip()
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         logger.error(f"Failed to open editor: {e}")
         console.print("[bold red]Error: Failed to open editor. Using original message.[/bold red]")
         return initial_message
     finally:
-        os.remove(temp_file.name)
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
 
 
-def perform_commit(message: str) -> None:
+def perform_commit(message: str, confirm: bool = True) -> bool:
     """
     Ask the user to confirm the commit message and perform the commit if confirmed.
+    Returns whether the commit was created.
     """
-    if not Confirm.ask(
+    import subprocess
+    from rich.markup import escape
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    if confirm and _IS_TTY and not Confirm.ask(
         "[bold yellow]Are you sure you want to commit with this message?[/bold yellow]",
         default=True,
     ):
         console.print("[bold blue]Commit cancelled.[/bold blue]")
         logger.info("Commit cancelled by user")
-        return
+        return False
 
     with Progress(
         SpinnerColumn(),
@@ -147,23 +186,33 @@ def perform_commit(message: str) -> None:
     ) as progress:
         task = progress.add_task("[cyan]Committing changes...", total=None)
 
-        try:
-            result = subprocess.run(
-                ["git", "commit", "-m", message],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            progress.update(task, completed=True)
-            console.print(
-                f"[bold green]Commit successfully created.[/bold green]\n{result.stdout}"
-            )
-            logger.info("Commit successfully created")
-        except subprocess.CalledProcessError as e:
-            progress.update(task, completed=True)
-            error_message = f"Git commit failed: {e.stderr}"
-            console.print(f"[bold red]Error: {error_message}[/bold red]")
-            logger.error(error_message)
+        # Hooks can run for a while, so show their output as it arrives
+        process = subprocess.Popen(
+            ["git", "commit", "-m", message],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        assert process.stdout is not None
+        output_lines: List[str] = []
+        for line in process.stdout:
+            output_lines.append(line)
+            if line.strip():
+                progress.update(task, description=f"[cyan]{escape(line.strip()[:60])}")
+        returncode = process.wait()
+        output = "".join(output_lines)
+        progress.update(task, description="[cyan]Committing changes...", completed=True)
+
+    if returncode == 0:
+        console.print(f"[bold green]Commit successfully created.[/bold green]\n{output}")
+        logger.info("Commit successfully created")
+        return True
+
+    error_message = f"Git commit failed: {output}"
+    console.print(f"[bold red]Error: {error_message}[/bold red]")
+    logger.error(error_message)
+    return False
 
 
 def display_ai_model_info(provider: str) -> None:
@@ -191,9 +240,7 @@ def display_commit_message(message: str, title: str) -> None:
     """
     Display the commit message in a panel that wraps text properly.
     """
-    wrapped_message = "\n".join(
-        line.strip() for line in message.split("\n") if line.strip()
-    )
+    wrapped_message = "\n".join(filter(None, map(str.strip, message.split("\n"))))
     panel = Panel(
         wrapped_message,
         title=title,
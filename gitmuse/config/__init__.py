@@ -0,0 +1,3 @@
+from .settings import CONFIG, DEFAULT_CONFIG, Config, ConfigError
+
+__all__ = ["CONFIG", "DEFAULT_CONFIG", "Config", "ConfigError"]
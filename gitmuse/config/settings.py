@@ -1,9 +1,10 @@
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from typing_extensions import TypedDict
 
-import jsonschema  # type: ignore
 from pydantic import BaseModel
 from gitmuse.utils.logging import configure_logging, get_logger
 
@@ -118,6 +119,55 @@ DEFAULT_CONFIG: ConfigDict = {
 SCHEMA_PATH = Path(__file__).parent / "gitmuse-schema.json"
 
 
+@lru_cache(maxsize=1)
+def _load_schema(mtime: float) -> Dict[str, Any]:
+    """Parse the schema file, reusing the result until its mtime changes."""
+    return json.loads(SCHEMA_PATH.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _load_validator(mtime: float) -> Any:
+    """Build a validator for the schema file once per mtime.
+
+    The validator class follows the schema's $schema draft.
+    """
+    import jsonschema  # type: ignore
+
+    schema = _load_schema(mtime)
+    return jsonschema.validators.validator_for(schema)(schema)
+
+
+def _skip_schema_validation() -> bool:
+    # Opt-in for setups whose config files are already validated elsewhere
+    return os.getenv("GITMUSE_SKIP_SCHEMA_VALIDATION", "").lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=32)
+def find_repository_root(start_path: Path) -> Optional[Path]:
+    """Find the root of the git repository containing an already resolved path."""
+    current_path = str(start_path)
+    parent_path = os.path.dirname(current_path)
+    while current_path != parent_path:
+        try:
+            os.stat(os.path.join(current_path, ".git"), follow_symlinks=False)
+            return Path(current_path)
+        except OSError:
+            # Missing, not a directory, or an ancestor we may not read
+            pass
+        current_path, parent_path = parent_path, os.path.dirname(parent_path)
+    return None
+
+
+def _deep_merge(base: Any, overlay: Any) -> Any:
+    """Merge overlay into base without modifying either, recursing into nested dicts."""
+    if not isinstance(base, dict) or not isinstance(overlay, dict):
+        return overlay
+    merged = dict(base)
+    for key, value in overlay.items():
+        merged[key] = _deep_merge(base[key], value) if key in base else value
+    return merged
+
+
 class ConfigError(Exception):
     """Custom exception for configuration errors."""
 
@@ -159,10 +209,25 @@ class Config:
     Loads and validates the configuration from a JSON file and provides access to the configuration values.
     """
 
-    def __init__(self):
+    _instance: Optional["Config"] = None
+
+    def __new__(cls) -> "Config":
+        # Loading reads files and configures logging, so it happens only once
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self) -> None:
+        if getattr(self, "_initialized", False):
+            return
         self.config = self.load_config()
+        # The config is not modified after loading, so dump it only once
+        self._config_dump: Dict[str, Any] = self.config.model_dump()
+        self._nested_cache: Dict[Tuple[str, ...], Any] = {}
+        self._provider: str = self.config.ai.provider
         self.setup_logging()
         self.logger = get_logger(__name__)
+        self._initialized = True
 
     def setup_logging(self):
         log_config = self.config.logging
@@ -174,42 +239,59 @@ class Config:
         )
 
     def load_schema(self) -> Optional[Dict[str, Any]]:
-        if SCHEMA_PATH.exists():
-            with SCHEMA_PATH.open("r") as f:
-                return json.load(f)
-        print(f"Warning: Schema file not found at {SCHEMA_PATH}")
-        return None
+        mtime = self._schema_mtime()
+        return _load_schema(mtime) if mtime is not None else None
+
+    def load_validator(self) -> Optional[Any]:
+        mtime = self._schema_mtime()
+        return _load_validator(mtime) if mtime is not None else None
+
+    def validate_config(self, config_dict: Any) -> None:
+        validator = self.load_validator()
+        if validator is None:
+            return
+        # jsonschema is only imported once there is a user config to check
+        import jsonschema  # type: ignore
+
+        try:
+            validator.validate(config_dict)
+        except jsonschema.exceptions.ValidationError as e:
+            raise ConfigError(f"Invalid configuration: {str(e)}")
 
     @staticmethod
-    def find_repository_root(start_path: Path = Path.cwd()) -> Optional[Path]:
+    def _schema_mtime() -> Optional[float]:
+        try:
+            return SCHEMA_PATH.stat().st_mtime
+        except FileNotFoundError:
+            print(f"Warning: Schema file not found at {SCHEMA_PATH}")
+            return None
+
+    @staticmethod
+    def find_repository_root(start_path: Optional[Path] = None) -> Optional[Path]:
         """Find the root of the git repository."""
-        current_path = start_path.resolve()
-        while current_path != current_path.parent:
-            if (current_path / ".git").exists():
-                return current_path
-            current_path = current_path.parent
-        return None
+        return find_repository_root((start_path or Path.cwd()).resolve())
 
     def load_config(self) -> ConfigModel:
-        config_dict: ConfigDict = DEFAULT_CONFIG.copy()
+        config_dict: ConfigDict = DEFAULT_CONFIG
         possible_paths = [
             Path.cwd() / "gitmuse.json",
             Path.home() / ".config" / "gitmuse" / "gitmuse.json",
             Path("/etc/gitmuse/gitmuse.json"),
         ]
 
-        for config_path in possible_paths:
-            if config_path.exists():
-                try:
-                    user_config = json.loads(config_path.read_text())
-                    schema = self.load_schema()
-                    if schema:
-                        jsonschema.validate(instance=config_dict, schema=schema)
-                    config_dict.update(user_config)
-                    print(f"Loaded configuration from {config_path}")
-                    break
-                except (json.JSONDecodeError, jsonschema.exceptions.ValidationError) as e:
-                    raise ConfigError(f"Invalid configuration: {str(e)}")
+        config_path = next((path for path in possible_paths if path.is_file()), None)
+        if config_path is not None:
+            try:
+                user_config = json.loads(config_path.read_bytes())
+            except json.JSONDecodeError as e:
+                raise ConfigError(f"Invalid configuration: {str(e)}")
+            # Overrides only replace the leaves they set, so partial
+            # sections keep the remaining defaults
+            config_dict = _deep_merge(DEFAULT_CONFIG, user_config)
+            # Files that only restate defaults cannot fail validation
+            if config_dict != DEFAULT_CONFIG and not _skip_schema_validation():
+                self.validate_config(config_dict)
+            print(f"Loaded configuration from {config_path}")
 
         return ConfigModel(
             version=config_dict["version"],
@@ -221,29 +303,29 @@ class Config:
 
     def get_nested_config(self, *keys: str) -> Any:
         """Get a nested configuration value."""
-        value = self.config.model_dump() 
+        if keys in self._nested_cache:
+            return self._nested_cache[keys]
+        value = self._config_dump
         for key in keys:
             try:
                 value = value[key]
             except KeyError:
                 self.logger.error(f"Configuration key '{key}' not found.")
                 raise ConfigError(f"Configuration key '{key}' not found.")
+        self._nested_cache[keys] = value
         return value
 
     def get_ai_provider(self) -> str:
-        return self.get_nested_config("ai", "provider")
+        return self._provider
 
     def get_ai_model(self) -> str:
-        provider = self.get_ai_provider()
-        return self.get_nested_config("ai", provider, "model")
+        return self.get_nested_config("ai", self._provider, "model")
 
     def get_max_tokens(self) -> int:
-        provider = self.get_ai_provider()
-        return self.get_nested_config("ai", provider, "max_tokens")
+        return self.get_nested_config("ai", self._provider, "max_tokens")
 
     def get_temperature(self) -> float:
-        provider = self.get_ai_provider()
-        return self.get_nested_config("ai", provider, "temperature")
+        return self.get_nested_config("ai", self._provider, "temperature")
 
     def get_openai_api_key(self) -> str:
         return self.get_nested_config("ai", "openai", "apiKey")
@@ -286,6 +368,7 @@ class Config:
 
     def init_config(self, path: Optional[Path] = None) -> None:
         """Initialize a new configuration file."""
+        self._nested_cache.clear()
         if path is None:
             repo_root = self.find_repository_root()
             path = (
@@ -1,25 +1,45 @@
-from typing import List, Tuple, Set, Dict, Literal, Sequence
-import difflib
+from typing import AbstractSet, FrozenSet, List, Tuple, Dict, Literal, Sequence
+import re
 from gitmuse.core.git_utils import (
     get_gitignore_patterns,
+    get_ignore_matcher,
     get_staged_files,
-    run_command,
-    should_ignore,
+    get_ignored_files,
     StagedFile,
-    get_full_diff,
+    get_diff_batch,
+    get_diffs,
+    parse_diff_header,
 )
 from gitmuse.utils.logging import get_logger
 from rich.console import Console
-from rich.progress import Progress
 from rich.table import Table
 from rich.panel import Panel
 
-ADDITIONAL_IGNORE_PATTERNS = {
-    "poetry.lock",
-    "package-lock.json",
-    "yarn.lock",
-    "bun.lock",
+ADDITIONAL_IGNORE_PATTERNS: FrozenSet[str] = frozenset(
+    {
+        "poetry.lock",
+        "package-lock.json",
+        "yarn.lock",
+        "bun.lock",
+    }
+)
+
+# Start of each file's section in a git diff
+DIFF_START_RE = re.compile(r"^diff --git ", re.MULTILINE)
+# First line after a file's extended header
+HEADER_END_RE = re.compile(r"^(?:@@|--- |Binary files )", re.MULTILINE)
+# Extended header lines that are left out of a change's content
+HEADER_LINE_RE = re.compile(
+    r"^(?:new file|deleted file|rename from|index).*(?:\n|$)", re.MULTILINE
+)
+STATUS_HEADER_RE = re.compile(r"^(new file|deleted file|rename from)", re.MULTILINE)
+STATUS_BY_HEADER = {
+    "new file": "added",
+    "deleted file": "deleted",
+    "rename from": "renamed",
 }
+# File/Status lines commit_command puts in front of each file's diff
+PREAMBLE_RE = re.compile(r"^File: .*\nStatus: .*(?:\n|$)", re.MULTILINE)
 
 FileStatus = Literal["A", "M", "D", "R100"]
 
@@ -28,14 +48,24 @@ logger = get_logger(__name__)
 
 
 class GitDiffAnalyzer:
-    def __init__(self, ignore_patterns: Set[str], staged_files: Sequence[StagedFile]):
+    _EMOJI_BY_STATUS: Dict[str, str] = {
+        "added": "✨",
+        "modified": "🔨",
+        "deleted": "🗑️",
+        "renamed": "🚚",
+    }
+
+    def __init__(
+        self, ignore_patterns: AbstractSet[str], staged_files: Sequence[StagedFile]
+    ):
         """
         Initializes the GitDiffAnalyzer.
 
         :param ignore_patterns: A set of file patterns to ignore.
         :param staged_files: A list of StagedFile instances containing the status and path of staged files.
         """
-        self.ignore_patterns = ignore_patterns.union(ADDITIONAL_IGNORE_PATTERNS)
+        self.ignore_patterns = frozenset(ignore_patterns) | ADDITIONAL_IGNORE_PATTERNS
+        self.ignore_matcher = get_ignore_matcher(self.ignore_patterns)
         self.staged_files = staged_files
 
     def get_diff(self) -> Tuple[str, List[str]]:
@@ -44,73 +74,35 @@ class GitDiffAnalyzer:
 
         :return: A tuple with the filtered diff and a list of ignored files.
         """
-        filtered_diff = get_full_diff()
-        ignored_files = []
-
-        with Progress() as progress:
-            task = progress.add_task(
-                "[cyan]Processing staged files...", total=len(self.staged_files)
-            )
-
-            for file in self.staged_files:
-                progress.update(task, advance=1)
-                if should_ignore(
-                    file.file_path, self.ignore_patterns, self.staged_files
-                ):
-                    ignored_files.append(file.file_path)
-                    logger.info(f"Ignored file: {file.file_path}")
-
-        return filtered_diff, ignored_files
-
-    def _get_file_contents(self, status: str, file_path: str) -> Tuple[str, str]:
-        """
-        Gets the file contents based on the status.
-
-        :param status: The status of the file (A, M, D, R100).
-        :param file_path: The path of the file.
-        :return: A tuple with the old and new content of the file.
-        """
-        try:
-            if status == "A":
-                return "", self._run_git_command([":0", file_path])
-            elif status == "D":
-                return self._run_git_command(["HEAD", file_path]), ""
-            else:
-                old_content = self._run_git_command(["HEAD", file_path])
-                new_content = self._run_git_command([":0", file_path])
-                return old_content, new_content
-        except Exception as e:
-            logger.error(f"Error retrieving file contents for {file_path}: {e}")
-            return "", ""
-
-    def _run_git_command(self, ref_file: List[str]) -> str:
-        """
-        Runs a git show command and returns the content.
-
-        :param ref_file: Reference and file for the git show command.
-        :return: The content of the file.
-        """
-        return run_command(["git", "show", f"{ref_file[0]}:{ref_file[1]}"]).stdout
-
-    def _generate_diff(
-        self, file_path: str, old_content: str, new_content: str
-    ) -> List[str]:
-        """
-        Generates a unified diff between the old and new content of the file.
-
-        :param file_path: The path of the file.
-        :param old_content: The old content of the file.
-        :param new_content: The new content of the file.
-        :return: A list of lines representing the diff.
-        """
-        return list(
-            difflib.unified_diff(
-                old_content.splitlines(keepends=True),
-                new_content.splitlines(keepends=True),
-                fromfile=f"a/{file_path}",
-                tofile=f"b/{file_path}",
-            )
+        diff_map = get_diff_batch()
+        ignored_paths = get_ignored_files(
+            [file.current_path for file in self.staged_files], self.ignore_matcher
         )
+        # The batch is keyed by the post-image path, fall back to per-file
+        # diffs for anything it did not cover
+        missing_paths = [
+            file.current_path
+            for file in self.staged_files
+            if file.status[0] != "D"
+            and file.current_path not in ignored_paths
+            and file.current_path not in diff_map
+        ]
+        if missing_paths:
+            diff_map.update(get_diffs(missing_paths))
+
+        diff_parts: List[str] = []
+        ignored_files: List[str] = []
+        for file in self.staged_files:
+            if file.current_path in ignored_paths:
+                ignored_files.append(file.file_path)
+                logger.info(f"Ignored file: {file.file_path}")
+            elif diff_map.get(file.current_path):
+                diff_parts.append(
+                    f"File: {file.file_path}\nStatus: {file.status}\n"
+                    f"{diff_map[file.current_path]}\n\n"
+                )
+
+        return "".join(diff_parts), ignored_files
 
     def analyze_diff(self, diff: str) -> Dict[str, List[Dict[str, str]]]:
         """
@@ -125,32 +117,23 @@ class GitDiffAnalyzer:
             "deleted": [],
             "renamed": [],
         }
-        current_file = ""
-        current_status = ""
-        current_content: List[str] = []
-
-        for line in diff.split("\n"):
-            if line.startswith("diff --git"):
-                if current_file:
-                    self._append_change(
-                        changes, current_status, current_file, current_content
-                    )
-                current_file = line.split(" b/")[-1]
-                current_content = []
-            elif line.startswith("new file"):
-                current_status = "added"
-            elif line.startswith("deleted file"):
-                current_status = "deleted"
-            elif line.startswith("rename from"):
-                current_status = "renamed"
-            elif line.startswith("index"):
-                if not current_status:
-                    current_status = "modified"
-            else:
-                current_content.append(line)
-
-        if current_file:
-            self._append_change(changes, current_status, current_file, current_content)
+
+        starts = [match.start() for match in DIFF_START_RE.finditer(diff)]
+        for start, end in zip(starts, starts[1:] + [len(diff)]):
+            # The next file's File:/Status: lines trail this section, they can
+            # end up in its header when the section has no hunks
+            section = PREAMBLE_RE.sub("", diff[start:end])
+            header_line, _, rest = section.partition("\n")
+            # The extended header runs up to the first hunk or file marker
+            header_end = HEADER_END_RE.search(rest)
+            split_at = header_end.start() if header_end else len(rest)
+            header, body = rest[:split_at], rest[split_at:]
+
+            status_match = STATUS_HEADER_RE.search(header)
+            status = STATUS_BY_HEADER[status_match.group(1)] if status_match else "modified"
+            content = HEADER_LINE_RE.sub("", header) + body
+            file = parse_diff_header(header_line) or header_line.split(" b/")[-1]
+            self._append_change(changes, status, file, content)
 
         return changes
 
@@ -159,7 +142,7 @@ class GitDiffAnalyzer:
         changes: Dict[str, List[Dict[str, str]]],
         status: str,
         file: str,
-        content: List[str],
+        content: str,
     ) -> None:
         """
         Appends a change to the changes dictionary.
@@ -169,19 +152,17 @@ class GitDiffAnalyzer:
         :param file: The name of the file.
         :param content: The content of the change.
         """
-        changes[status].append({"file": file, "content": "\n".join(content).strip()})
+        changes[status].append({"file": file, "content": content.strip()})
 
-    @staticmethod
-    def _get_status_emoji(status: str) -> str:
+    @classmethod
+    def _get_status_emoji(cls, status: str) -> str:
         """
         Gets the corresponding emoji for a file status.
 
         :param status: The status of the file.
         :return: A string containing the emoji.
         """
-        return {"added": "✨", "modified": "🔨", "deleted": "🗑️", "renamed": "🚚"}.get(
-            status, ""
-        )
+        return cls._EMOJI_BY_STATUS.get(status, "")
 
 
 def analyze_diff(diff: str) -> Dict[str, List[Dict[str, str]]]:
@@ -204,22 +185,30 @@ def display_analysis(
     :param analysis: The analysis dictionary.
     :param ignored_files: List of ignored files.
     """
-    table = Table(title="Git Diff Analysis")
-    table.add_column("Change Type", style="bold cyan")
-    table.add_column("File", style="bold green")
-    table.add_column("Content Preview", style="dim")
-
+    rows: List[Tuple[str, str, str]] = []
     for change_type, files in analysis.items():
+        label = f"{GitDiffAnalyzer._get_status_emoji(change_type)} {change_type.capitalize()}"
         for file_info in files:
-            content_preview = file_info["content"].split("\n")[0][:50]
-            emoji = GitDiffAnalyzer._get_status_emoji(change_type)
-            table.add_row(
-                f"{emoji} {change_type.capitalize()}",
-                file_info["file"],
-                content_preview + ("..." if len(content_preview) == 50 else ""),
+            content_preview = file_info["content"].partition("\n")[0][:50]
+            rows.append(
+                (
+                    label,
+                    file_info["file"],
+                    content_preview + ("..." if len(content_preview) == 50 else ""),
+                )
             )
 
-    console.print(Panel.fit(table, title="Analysis Summary"))
+    if not console.is_terminal:
+        # Plain tab separated rows when the output goes to a pipe or a log
+        print("\n".join("\t".join(row) for row in rows), file=console.file)
+    else:
+        table = Table(title="Git Diff Analysis")
+        table.add_column("Change Type", style="bold cyan")
+        table.add_column("File", style="bold green")
+        table.add_column("Content Preview", style="dim")
+        for row in rows:
+            table.add_row(*row)
+        console.print(Panel.fit(table, title="Analysis Summary"))
 
     if ignored_files:
         ignored_panel = Panel.fit(
@@ -228,14 +217,13 @@ def display_analysis(
         console.print(ignored_panel)
 
 
-def get_diff_summary(diff: str) -> str:
+def get_diff_summary(analysis: Dict[str, List[Dict[str, str]]]) -> str:
     """
-    Generates a summary of the diff.
+    Generates a summary of an analyzed diff.
 
-    :param diff: The diff as a string.
+    :param analysis: The analysis dictionary returned by analyze_diff.
     :return: A string summarizing the changes.
     """
-    analysis = analyze_diff(diff)
     summary = []
     for change_type, files in analysis.items():
         if files:
@@ -255,7 +243,7 @@ def main() -> None:
     analysis = analyzer.analyze_diff(diff)
     display_analysis(analysis, ignored_files)
 
-    summary = get_diff_summary(diff)
+    summary = get_diff_summary(analysis)
     console.print(f"\n[bold green]Summary:[/bold green] {summary}")
 
 
@@ -1,20 +1,63 @@
 import os
+import re
+import shutil
 import subprocess
-from typing import List, Optional, Set, Sequence, Tuple
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from functools import lru_cache
-from gitmuse.models import StagedFile
+from gitmuse.models import DiffStat, StagedFile
+from gitmuse.utils.logging import get_logger
 
 console = Console()
+logger = get_logger(__name__)
+
+DIFF_HEADER_RE = re.compile(r"^diff --git a/.+? b/(.+)$")
+SHORTSTAT_RE = re.compile(
+    r"(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?"
+)
+# Options for the diffs that are parsed per file. The explicit prefixes keep
+# the "a/" and "b/" headers parse_diff_header expects whatever diff.noprefix
+# or diff.mnemonicPrefix say.
+DIFF_OPTIONS = (
+    "--no-color",
+    "--no-ext-diff",
+    "--src-prefix=a/",
+    "--dst-prefix=b/",
+    "--unified=10",
+)
 
 
 def run_command(
-    command: List[str], input_text: Optional[str] = None, check: bool = False
+    command: List[str],
+    input_text: Optional[str] = None,
+    check: bool = False,
+    text: bool = True,
 ) -> subprocess.CompletedProcess:
     try:
+        # Without input, give the child an empty stdin so it can never block on
+        # the terminal's. subprocess already closes inherited fds with close_range.
         return subprocess.run(
-            command, input=input_text, capture_output=True, text=True, check=check
+            command,
+            input=input_text,
+            stdin=subprocess.DEVNULL if input_text is None else None,
+            capture_output=True,
+            text=text,
+            check=check,
         )
     except subprocess.CalledProcessError as e:
         console.print(f"[bold yellow]Command failed:[/bold yellow] {' '.join(command)}")
@@ -22,77 +65,230 @@ def run_command(
         raise
 
 
+def _decode(output: bytes) -> str:
+    # Diffs and blobs can contain arbitrary bytes, decode them once at the end
+    return output.decode("utf-8", errors="replace")
+
+
+@lru_cache(maxsize=None)
 def check_dependency(dependency: str) -> None:
-    result = run_command(["which", dependency])
-    if result.returncode != 0:
+    if shutil.which(dependency) is None:
         raise RuntimeError(
             f"{dependency} is not installed. Please install it with 'pip install {dependency}'."
         )
 
 
 def check_staging_area() -> bool:
-    result = run_command(["git", "diff", "--cached", "--quiet"])
-    return result.returncode != 0
+    """
+    Check whether anything is staged, from the same cached summary as
+    get_staged_files. Call clear_git_caches() after changing the index.
+    """
+    return bool(_load_staged_summary()[0])
 
 
 @lru_cache(maxsize=1)
-def get_staged_files() -> List[StagedFile]:
-    result = run_command(["git", "diff", "--cached", "--name-status"])
+def _load_staged_summary() -> Tuple[List[StagedFile], DiffStat]:
+    """
+    Read the staged files and the size of the change with a single git call.
+
+    '--raw' lists every file with its status and '--shortstat' adds the totals
+    line, so this covers what '--quiet', '--name-status' and '--shortstat'
+    would each need their own process for. The result is kept for the rest of
+    the process, see clear_git_caches().
+    """
+    result = run_command(["git", "diff", "--cached", "--raw", "--shortstat"], text=False)
+    if result.returncode != 0:
+        # Failures are not cached, so the next call asks git again
+        raise RuntimeError(
+            f"Could not read the staged changes: {_decode(result.stderr).strip()}"
+        )
     staged_files: List[StagedFile] = []
-    for line in result.stdout.splitlines():
-        parts = line.split(maxsplit=1)
-        if len(parts) == 2:
-            status, file_path = parts
-            staged_files.append(StagedFile(status=status, file_path=file_path))
-        else:
+    diff_stat = DiffStat()
+    # Split the bytes and only decode the fields that are kept
+    for raw_line in result.stdout.splitlines():
+        # ":<old mode> <new mode> <old sha> <new sha> <status>\t<path>"
+        meta, tab, file_path = raw_line.partition(b"\t")
+        if raw_line.startswith(b":") and tab:
+            staged_files.append(
+                StagedFile(
+                    status=meta.rsplit(b" ", 1)[-1].decode("ascii", errors="replace"),
+                    file_path="\t".join(
+                        unquote_path(part) for part in _decode(file_path).split("\t")
+                    ),
+                )
+            )
+            continue
+        line = _decode(raw_line)
+        if match := SHORTSTAT_RE.search(line):
+            files_changed, insertions, deletions = (
+                int(group or 0) for group in match.groups()
+            )
+            diff_stat = DiffStat(
+                files_changed=files_changed, insertions=insertions, deletions=deletions
+            )
+        elif line:
             console.print(
                 f"[bold yellow]Warning: Unexpected git diff output: {line}[/bold yellow]"
             )
-    console.print(f"Staged files: {staged_files}")
+    return staged_files, diff_stat
+
+
+@lru_cache(maxsize=1)
+def get_staged_files() -> List[StagedFile]:
+    staged_files = _load_staged_summary()[0]
+    # Arguments are only formatted when debug logging is enabled
+    logger.debug("Staged files: %s", staged_files)
     return staged_files
 
 
+@lru_cache(maxsize=None)
+def _read_gitignore(directory: str) -> FrozenSet[str]:
+    try:
+        with open(os.path.join(directory, ".gitignore"), "rb") as f:
+            lines = _decode(f.read()).splitlines()
+    except OSError:
+        return frozenset()
+    return frozenset(
+        line.strip() for line in lines if line.strip() and not line.startswith("#")
+    )
+
+
+def _ancestor_directories(file_path: str) -> Iterator[str]:
+    directory = os.path.dirname(file_path)
+    while directory:
+        yield directory
+        directory = os.path.dirname(directory)
+    yield "."
+
+
 @lru_cache(maxsize=1)
 def get_gitignore_patterns() -> Set[str]:
-    ignore_patterns: Set[str] = set()
-    for root, _, files in os.walk("."):
-        if ".gitignore" in files:
-            with open(os.path.join(root, ".gitignore"), "r") as f:
-                ignore_patterns.update(
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.startswith("#")
-                )
-    console.print(f"Loaded gitignore patterns: {ignore_patterns}")
+    """
+    Collect the patterns of the .gitignore files that can apply to the staged
+    files, reading only the directories on their paths instead of the whole tree.
+    """
+    # Staged paths are relative to the repository root, not the working directory
+    repo_root = get_repo_root()
+    directories = dict.fromkeys(
+        os.path.join(repo_root, directory)
+        for file in get_staged_files()
+        # Renames are listed as "<old path>\t<new path>"
+        for path in file.file_path.split("\t")
+        for directory in _ancestor_directories(path)
+    )
+    ignore_patterns: Set[str] = set().union(*map(_read_gitignore, directories))
+    logger.debug("Loaded gitignore patterns: %s", ignore_patterns)
     return ignore_patterns
 
 
-def should_ignore(
-    file_path: str, ignore_patterns: Set[str], staged_files: Sequence[StagedFile]
-) -> bool:
-    if file_path in [file.file_path for file in staged_files]:
-        return False
-    for pattern in ignore_patterns:
-        if (
-            (pattern.startswith("/") and fnmatch.fnmatch(file_path, pattern[1:]))
-            or (fnmatch.fnmatch(file_path, pattern))
-            or ("/" in pattern and fnmatch.fnmatch(file_path, pattern))
-            or (fnmatch.fnmatch(os.path.basename(file_path), pattern))
-        ):
-            console.print(f"File {file_path} ignored due to pattern: {pattern}")
-            return True
-    return False
+class IgnoreMatcher:
+    """
+    Precompiled matcher for a set of gitignore patterns.
+    """
+
+    def __init__(self, ignore_patterns: AbstractSet[str]):
+        """
+        Translates every pattern to a regular expression once.
+
+        :param ignore_patterns: A set of file patterns to ignore.
+        """
+        self.patterns: FrozenSet[str] = frozenset(ignore_patterns)
+        self._rules: List[Tuple[str, List[Pattern[str]], Pattern[str]]] = []
+        # Results per path, the same files are checked many times over a run
+        self._matches: Dict[str, Optional[str]] = {}
+        for pattern in self.patterns:
+            path_patterns = [pattern[1:], pattern] if pattern.startswith("/") else [pattern]
+            self._rules.append(
+                (
+                    pattern,
+                    [_compile_fnmatch(p) for p in path_patterns],
+                    _compile_fnmatch(pattern),
+                )
+            )
+        # One alternation over every rule, so a file that no pattern ignores
+        # (the common case) costs two regex matches instead of a scan of the rules
+        self._any_path = _union(
+            regex for _, path_regexes, _ in self._rules for regex in path_regexes
+        )
+        self._any_basename = _union(regex for _, _, regex in self._rules)
+
+    def match(self, file_path: str) -> Optional[str]:
+        """
+        Finds the pattern that ignores a file.
+
+        :param file_path: The path of the file.
+        :return: The first matching pattern, or None if the file is not ignored.
+        """
+        if file_path in self._matches:
+            return self._matches[file_path]
+        path = os.path.normcase(file_path)
+        basename = os.path.basename(path)
+        match: Optional[str] = None
+        if not (self._any_path.match(path) or self._any_basename.match(basename)):
+            self._matches[file_path] = match
+            return match
+        for pattern, path_regexes, basename_regex in self._rules:
+            if any(regex.match(path) for regex in path_regexes) or basename_regex.match(
+                basename
+            ):
+                match = pattern
+                break
+        self._matches[file_path] = match
+        return match
+
+
+def _compile_fnmatch(pattern: str) -> Pattern[str]:
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def _union(regexes: Iterable[Pattern[str]]) -> Pattern[str]:
+    alternatives = "|".join(f"(?:{regex.pattern})" for regex in regexes)
+    # An empty alternation would match everything, use one that never does
+    return re.compile(alternatives or r"(?!)")
+
+
+@lru_cache(maxsize=8)
+def get_ignore_matcher(ignore_patterns: FrozenSet[str]) -> IgnoreMatcher:
+    return IgnoreMatcher(ignore_patterns)
+
+
+def get_ignored_files(
+    file_paths: Iterable[str],
+    ignore_patterns: Union[AbstractSet[str], IgnoreMatcher],
+) -> Set[str]:
+    """
+    Matches many files against the ignore patterns in one pass.
+
+    The files are usually staged ones, so this reports files that are staged
+    but should be left out of the diff sent to the AI provider.
+
+    :param file_paths: The paths of the files to check.
+    :param ignore_patterns: A set of file patterns, or a precompiled matcher.
+    :return: The subset of file_paths that should be ignored.
+    """
+    matcher = (
+        ignore_patterns
+        if isinstance(ignore_patterns, IgnoreMatcher)
+        else get_ignore_matcher(frozenset(ignore_patterns))
+    )
+    ignored_files: Set[str] = set()
+    for file_path in file_paths:
+        pattern = matcher.match(file_path)
+        if pattern is not None:
+            logger.debug("File %s ignored due to pattern: %s", file_path, pattern)
+            ignored_files.add(file_path)
+    return ignored_files
 
 
 def get_file_content(file_path: str, revision: str = "HEAD") -> str:
     try:
         if revision == "staged":
-            result = run_command(["git", "show", f":0:{file_path}"])
+            result = run_command(["git", "show", f":0:{file_path}"], text=False)
         else:
-            result = run_command(["git", "show", f"{revision}:{file_path}"])
+            result = run_command(["git", "show", f"{revision}:{file_path}"], text=False)
 
         if result.returncode == 0:
-            return result.stdout
+            return _decode(result.stdout)
         else:
             console.print(
                 f"[bold yellow]Warning: Could not get content for {file_path} at {revision}[/bold yellow]"
@@ -106,16 +302,18 @@ def get_file_content(file_path: str, revision: str = "HEAD") -> str:
 
 
 def get_diff(file_path: str) -> str:
+    cached_diff = _load_diff_batch().get(file_path)
+    if cached_diff is not None:
+        return cached_diff
     try:
-        if os.path.exists(file_path):
-            result = run_command(["git", "diff", "--cached", "--unified=10", file_path])
-        else:
-            result = run_command(
-                ["git", "diff", "--cached", "--unified=10", "--", "/dev/null", file_path]
-            )
+        # Staged paths are relative to the repository root, and taken literally
+        result = run_command(
+            ["git", "diff", "--cached", *DIFF_OPTIONS, "--", f":(top,literal){file_path}"],
+            text=False,
+        )
 
         if result.returncode == 0:
-            return result.stdout
+            return _decode(result.stdout)
         else:
             console.print(
                 f"[bold yellow]Warning: Could not get diff for {file_path}[/bold yellow]"
@@ -126,15 +324,165 @@ def get_diff(file_path: str) -> str:
         return ""
 
 
+_C_ESCAPES = {"a": 7, "b": 8, "t": 9, "n": 10, "v": 11, "f": 12, "r": 13}
+
+
+def unquote_path(path: str) -> str:
+    """
+    Undo the C-style quoting git applies to paths with special or non-ASCII
+    characters (see core.quotePath).
+
+    :param path: A path as printed by git, quoted or not.
+    :return: The path as it is on disk.
+    """
+    if len(path) < 2 or not (path.startswith('"') and path.endswith('"')):
+        return path
+    raw = bytearray()
+    chars = iter(path[1:-1])
+    for char in chars:
+        if char != "\\":
+            raw += char.encode("utf-8")
+            continue
+        escaped = next(chars, "")
+        if escaped in _C_ESCAPES:
+            raw.append(_C_ESCAPES[escaped])
+        elif escaped.isdigit():
+            # Three octal digits per byte of the UTF-8 encoded name
+            raw.append(int(escaped + next(chars, "") + next(chars, ""), 8))
+        else:
+            raw += escaped.encode("utf-8")
+    return _decode(bytes(raw))
+
+
+def parse_diff_header(line: str) -> Optional[str]:
+    """Return the post-image path from a ``diff --git a/<path> b/<path>`` header."""
+    rest = line[len("diff --git "):]
+    if rest.endswith('"'):
+        # A quoted post-image path, the quotes inside it are escaped so the
+        # first ' "b/' is where it starts
+        start = rest.find(' "b/')
+        if start != -1:
+            return unquote_path(rest[start + 1:])[2:]
+    if rest.startswith('"'):
+        # A quoted pre-image path with a plain post-image path
+        index = 1
+        while index < len(rest) and rest[index] != '"':
+            index += 2 if rest[index] == "\\" else 1
+        if rest.startswith(" b/", index + 1):
+            return rest[index + 4:]
+    # Without a rename both sides are identical, which lets us split paths
+    # that themselves contain " b/" unambiguously.
+    half = (len(rest) - 5) // 2
+    if rest.startswith("a/") and rest[2 + half:] == f" b/{rest[2:2 + half]}":
+        return rest[2:2 + half]
+    match = DIFF_HEADER_RE.match(line)
+    return match.group(1) if match else None
+
+
+def iter_diff_batch() -> Iterator[Tuple[str, str]]:
+    """
+    Stream the staged diff file by file from a single git invocation.
+
+    Only one file's diff is held in memory at a time.
+
+    :return: An iterator of (file path, diff text) pairs.
+    """
+    command = ["git", "diff", "--cached", *DIFF_OPTIONS]
+    with subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ) as process:
+        assert process.stdout is not None
+        current_path: Optional[str] = None
+        current_lines: List[bytes] = []
+        for line in process.stdout:
+            if line.startswith(b"diff --git "):
+                if current_path is not None:
+                    yield current_path, _decode(b"".join(current_lines))
+                current_path = parse_diff_header(_decode(line.rstrip(b"\n")))
+                current_lines = []
+            current_lines.append(line)
+        if current_path is not None:
+            yield current_path, _decode(b"".join(current_lines))
+    if process.returncode != 0:
+        console.print("[bold yellow]Warning: Could not get staged diff[/bold yellow]")
+
+
+@lru_cache(maxsize=1)
+def _load_diff_batch() -> Dict[str, str]:
+    return dict(iter_diff_batch())
+
+
+def get_diff_batch() -> Dict[str, str]:
+    """
+    Get the staged diff of every file with a single git invocation.
+
+    The git call runs once per process, like get_staged_files.
+
+    :return: A mapping of file path to that file's diff text.
+    """
+    return dict(_load_diff_batch())
+
+
+def _max_diff_workers() -> int:
+    workers = min(16, (os.cpu_count() or 1) * 2)
+    try:
+        import resource
+    except ImportError:  # Windows
+        return workers
+    # Every git subprocess holds a few pipes open, stay well below the fd limit
+    soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    if soft_limit == resource.RLIM_INFINITY:
+        return workers
+    return max(1, min(workers, soft_limit // 4))
+
+
+def get_diffs(file_paths: Sequence[str]) -> Dict[str, str]:
+    """
+    Get the staged diffs of several files, running one git process per file in parallel.
+
+    :param file_paths: The paths of the files.
+    :return: A mapping of file path to that file's diff text.
+    """
+    if len(file_paths) <= 1:
+        return {file_path: get_diff(file_path) for file_path in file_paths}
+    with ThreadPoolExecutor(max_workers=_max_diff_workers()) as executor:
+        return dict(zip(file_paths, executor.map(get_diff, file_paths)))
+
+
+def get_diff_stat() -> DiffStat:
+    """
+    Get the size of the staged changes from 'git diff --shortstat'.
+    """
+    return _load_staged_summary()[1]
+
+
 def get_full_diff() -> str:
-    result = run_command(["git", "diff", "--cached", "--unified=10"])
+    result = run_command(["git", "diff", "--cached", "--unified=10"], text=False)
     if result.returncode == 0:
-        return result.stdout
+        return _decode(result.stdout)
     else:
         console.print("[bold yellow]Warning: Could not get full diff[/bold yellow]")
         return ""
 
 
+def clear_git_caches() -> None:
+    """
+    Forget the staged files, diffs and gitignore patterns read so far, for
+    callers that change the index or working tree within one process.
+    """
+    for cached in (
+        _load_staged_summary,
+        get_staged_files,
+        _load_diff_batch,
+        get_gitignore_patterns,
+        _read_gitignore,
+    ):
+        cached.cache_clear()
+
+
 def get_repo_root() -> str:
     result = run_command(["git", "rev-parse", "--show-toplevel"])
     if result.returncode == 0:
@@ -1,6 +1,9 @@
 import os
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from string import Formatter
+from typing import Dict, List, Optional, Any, Tuple, Union
 from gitmuse.core.diff_analyzer import analyze_diff
 from gitmuse.config.settings import CONFIG
 from gitmuse.providers.openai import OpenAIProvider
@@ -10,6 +13,7 @@ from gitmuse.providers.base import (
     OpenAIConfig,
     OllamaConfig,
 )
+from gitmuse.core.prompt_cache import get_cache_key, get_cached_response, store_response
 from gitmuse.utils.logging import get_logger
 from rich.console import Console
 import json
@@ -18,13 +22,35 @@ import re
 console = Console()
 logger = get_logger(__name__)
 
+# Start of the placeholder message providers return when generation fails
+FALLBACK_MESSAGE_PREFIX = "📝 Update files\n\n"
 
-class Changes(BaseModel):
+# Markdown code fences some models wrap their JSON answer in
+CODE_FENCE_RE = re.compile(r"```(?:json)?\s*")
+# Emojis that start the title or a section in a plain-text answer
+SECTION_EMOJIS = ("💎", "✨", "⬆️", "🐛", "♻️", "📝", "🔧", "🚀")
+
+CODE_EXTENSIONS = frozenset({".py", ".js", ".ts", ".cpp", ".java"})
+DOCUMENTATION_EXTENSIONS = frozenset({".md", ".txt", ".rst"})
+CONFIGURATION_EXTENSIONS = frozenset({".json", ".yaml", ".yml", ".toml"})
+FILE_TYPE_BY_EXTENSION: Dict[str, str] = {
+    **dict.fromkeys(CODE_EXTENSIONS, "code"),
+    **dict.fromkeys(DOCUMENTATION_EXTENSIONS, "documentation"),
+    **dict.fromkeys(CONFIGURATION_EXTENSIONS, "configuration"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Changes:
     files_summary: str
     changes_summary: str
     detailed_changes: List[str]
 
 
+# The configuration is fixed for the process, so build each provider once and
+# reuse it for every commit message. Instances are shared across threads and
+# must not carry per-call state.
+@lru_cache(maxsize=4)
 def get_provider(provider: Optional[str] = None) -> AIProvider:
     providers: Dict[str, type[AIProvider]] = {
         "openai": OpenAIProvider,
@@ -58,6 +84,7 @@ def get_provider(provider: Optional[str] = None) -> AIProvider:
 
 
 
+@lru_cache(maxsize=4)
 def load_template(provider: str) -> str:
     template_path = f"templates/{provider}_template.txt"
     if os.path.exists(template_path):
@@ -119,31 +146,62 @@ def load_default_template() -> str:
     """
 
 
+@lru_cache(maxsize=1)
+def get_commit_type_keywords() -> str:
+    commit_types = CONFIG.get_conventional_commit_types()
+    return ", ".join(f"{emoji} {verb}" for verb, emoji in commit_types.items())
+
+
 def create_prompt_content(
     changes: Changes,
     use_default_template: bool = True,
     custom_template: str = "",
 ) -> str:
-    commit_types = CONFIG.get_conventional_commit_types()
-    keywords = ", ".join([f"{emoji} {verb}" for verb, emoji in commit_types.items()])
+    keywords = get_commit_type_keywords()
     provider = CONFIG.get_ai_provider() or "ollama"
     template = custom_template if not use_default_template else load_template(provider)
 
-    detailed_changes = "\n".join(changes.detailed_changes)
+    values = {
+        "files_summary": changes.files_summary,
+        "changes_summary": changes.changes_summary,
+        "detailed_changes": "\n".join(changes.detailed_changes),
+        "keywords": keywords,
+    }
 
-    return template.format(
-        files_summary=changes.files_summary,
-        changes_summary=changes.changes_summary,
-        detailed_changes=detailed_changes,
-        keywords=keywords,
+    segments = parse_template(template)
+    if segments is None:
+        return template.format(**values)
+    return "".join(
+        literal if field_name is None else literal + values[field_name]
+        for literal, field_name in segments
     )
 
 
+@lru_cache(maxsize=8)
+def parse_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Split a prompt template into (literal text, field name) segments once, so
+    filling it in is a plain join instead of a str.format parse every time.
+    Returns None for templates using conversions, format specs or anything but
+    plain named fields, which are left to str.format.
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return None
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
 def generate_commit_message(
     diff: str,
     provider: Optional[str] = None,
     use_default_template: Optional[bool] = None,
     custom_template: Optional[str] = None,
+    show_progress: bool = True,
+    use_cache: bool = True,
 ) -> str:
     try:
         changes_dict = analyze_diff(diff)
@@ -168,11 +226,28 @@ def generate_commit_message(
         logger.debug(f"Created prompt content: {prompt_content}")
         
         provider_instance = get_provider(provider)
-        message_json = provider_instance.generate_commit_message(prompt_content)
-        logger.info(f"Raw AI response: {message_json}")
+        cache_key = get_cache_key(
+            type(provider_instance).__name__,
+            getattr(provider_instance, "model", "") or "",
+            prompt_content,
+            provider_instance.config.temperature,
+            provider_instance.config.max_tokens,
+        )
+        cached_response = get_cached_response(cache_key) if use_cache else None
+        if cached_response is not None:
+            logger.info("Using cached AI response for identical changes")
+            message_json = cached_response
+        else:
+            message_json = provider_instance.generate_commit_message(
+                prompt_content, show_progress=show_progress
+            )
+            # Providers answer failures with a placeholder message, keep those out
+            if use_cache and not message_json.startswith(FALLBACK_MESSAGE_PREFIX):
+                store_response(cache_key, message_json)
+        logger.debug(f"Raw AI response: {message_json}")
         
         extracted_message = extract_message_from_raw_response(message_json)
-        logger.info(f"Extracted message: {extracted_message}")
+        logger.debug(f"Extracted message: {extracted_message}")
         
         if not extracted_message.strip():
             raise ValueError("Generated commit message is empty")
@@ -187,42 +262,37 @@ def generate_commit_message(
 
 
 def summarize_changes(changes: Dict[str, List[Dict[str, str]]]) -> Changes:
-    files_changed = list(
-        set(change["file"] for category in changes.values() for change in category)
-    )
-    files_summary = ", ".join(files_changed[:5]) + (
-        f" and {len(files_changed) - 5} more files" if len(files_changed) > 5 else ""
-    )
-    changes_summary = ", ".join(
-        f"{category.capitalize()}: {len(items)} file(s)"
-        for category, items in changes.items()
-        if items
-    )
-    detailed_changes = generate_detailed_changes(changes)
+    # One pass over the changes feeds all three summaries. The files are
+    # deduplicated in diff order, a set would shuffle them between runs.
+    files_changed: Dict[str, None] = {}
+    category_counts: List[str] = []
+    detailed_changes: List[str] = []
+    for category, items in changes.items():
+        if not items:
+            continue
+        label = category.capitalize()
+        category_counts.append(f"{label}: {len(items)} file(s)")
+        for item in items:
+            files_changed[item["file"]] = None
+            detailed_changes.append(describe_change(label, item))
+
+    file_count = len(files_changed)
+    files_summary = ", ".join(islice(files_changed, 5))
+    if file_count > 5:
+        files_summary = f"{files_summary} and {file_count - 5} more files"
     return Changes(
         files_summary=files_summary,
-        changes_summary=changes_summary,
+        changes_summary=", ".join(category_counts),
         detailed_changes=detailed_changes,
     )
 
 
-def generate_detailed_changes(changes: Dict[str, List[Dict[str, str]]]) -> List[str]:
-    detailed_changes = []
-    for category, items in changes.items():
-        for item in items:
-            file_ext = os.path.splitext(item["file"])[1]
-            file_type = "code" if file_ext in ['.py', '.js', '.ts', '.cpp', '.java'] else \
-                        "documentation" if file_ext in ['.md', '.txt', '.rst'] else \
-                        "configuration" if file_ext in ['.json', '.yaml', '.yml', '.toml'] else \
-                        "unknown"
-            
-            change_description = f"{category.capitalize()} in {file_type} file {item['file']}: "
-            if "content" in item:
-                change_description += f"{item['content'][:100]}..."
-            else:
-                change_description += "File modified"
-            detailed_changes.append(change_description)
-    return detailed_changes
+def describe_change(label: str, item: Dict[str, str]) -> str:
+    file_type = FILE_TYPE_BY_EXTENSION.get(os.path.splitext(item["file"])[1], "unknown")
+    change_description = f"{label} in {file_type} file {item['file']}: "
+    if "content" in item:
+        return change_description + f"{item['content'][:100]}..."
+    return change_description + "File modified"
 
 
 def format_commit_message(commit_data: Union[Dict[str, Any], str]) -> str:
@@ -266,7 +336,7 @@ def extract_message_from_raw_response(raw_response: str) -> str:
     Attempt to extract a usable commit message from a raw AI response.
     """
     # Remove any markdown code block indicators
-    raw_response = re.sub(r'```(?:json)?\s*', '', raw_response)
+    raw_response = CODE_FENCE_RE.sub('', raw_response)
     raw_response = raw_response.strip('`')
 
     # First, try to parse as JSON
@@ -287,7 +357,7 @@ def extract_message_from_raw_response(raw_response: str) -> str:
         line = line.strip()
         if not line:
             continue
-        if line.startswith(('💎', '✨', '⬆️', '🐛', '♻️', '📝', '🔧', '🚀')):
+        if line.startswith(SECTION_EMOJIS):
             if title:
                 current_section = line
             else:
@@ -308,16 +378,6 @@ def extract_message_from_raw_response(raw_response: str) -> str:
     return formatted_message.strip()
 
 
-def format_non_json_response(raw_response: str) -> str:
-    """
-    Format a non-JSON response into a commit message.
-    """
-    lines = raw_response.split('\n')
-    title = lines[0][:50] if lines else "Update files"
-    body = "\n".join(lines[1:])
-    return f"{title}\n\n{body}"
-
-
 if __name__ == "__main__":
     sample_diff = """
     diff --git a/gitmuse/core/diff_analyzer.py b/gitmuse/core/diff_analyzer.py
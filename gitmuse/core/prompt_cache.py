@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+from gitmuse.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Entries are small, but one is written per distinct set of staged changes
+MAX_CACHE_ENTRIES = 200
+MAX_CACHE_AGE = 30 * 24 * 60 * 60  # seconds
+
+
+def _cache_disabled() -> bool:
+    # Opt-out for getting a fresh message for changes that were already sent
+    return os.getenv("GITMUSE_DISABLE_PROMPT_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the directory holding cached AI responses, following XDG_CACHE_HOME.
+    """
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "gitmuse" / "prompts"
+
+
+def get_cache_key(
+    provider: str, model: str, prompt: str, temperature: float, max_tokens: int
+) -> str:
+    """
+    Hash a prompt together with the provider, model and generation options that answer it.
+
+    :param provider: The name of the AI provider.
+    :param model: The model the provider uses.
+    :param prompt: The full prompt sent to the provider.
+    :param temperature: The sampling temperature of the request.
+    :param max_tokens: The response length limit of the request.
+    :return: A hex digest identifying the request.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for part in (provider, model, prompt, repr(temperature), str(max_tokens)):
+        digest.update(part.encode("utf-8"))
+        # Separate the parts so ("ab", "c") and ("a", "bc") differ
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[str]:
+    """
+    Look up the response stored for a request.
+
+    :param key: A key from get_cache_key.
+    :return: The cached raw response, or None on a miss.
+    """
+    if _cache_disabled():
+        return None
+    path = get_cache_dir() / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > MAX_CACHE_AGE:
+            return None
+        with open(path, "r", encoding="utf-8") as file:
+            response = json.load(file).get("response")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return response if isinstance(response, str) else None
+
+
+def store_response(key: str, response: str) -> None:
+    """
+    Store a provider's raw response for a request.
+
+    Failures are logged and otherwise ignored, the cache is only an optimization.
+
+    :param key: A key from get_cache_key.
+    :param response: The raw response returned by the provider.
+    """
+    if _cache_disabled():
+        return
+    cache_dir = get_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"response": response}, file)
+            os.replace(temp_path, cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        _prune_cache(cache_dir)
+    except OSError as e:
+        logger.warning(f"Could not write the prompt cache: {e}")
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """
+    Remove expired entries, then the oldest ones beyond MAX_CACHE_ENTRIES.
+    """
+    entries = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    cutoff = time.time() - MAX_CACHE_AGE
+    for index, (mtime, path) in enumerate(entries):
+        if index >= MAX_CACHE_ENTRIES or mtime < cutoff:
+            # Another run may be pruning the same directory
+            path.unlink(missing_ok=True)
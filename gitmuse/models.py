@@ -1,8 +1,26 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
-class StagedFile(BaseModel):
+@dataclass(frozen=True, slots=True)
+class StagedFile:
     status: str
     file_path: str
 
-class IgnoredFile(BaseModel):
+    @property
+    def current_path(self) -> str:
+        # Renames and copies are listed as "<old path>\t<new path>"
+        return self.file_path.rpartition("\t")[2]
+
+@dataclass(frozen=True, slots=True)
+class IgnoredFile:
     file_path: str
+
+@dataclass(frozen=True, slots=True)
+class DiffStat:
+    files_changed: int = 0
+    insertions: int = 0
+    deletions: int = 0
+
+@dataclass(frozen=True, slots=True)
+class ProviderContext:
+    provider: str
+    openai_api_key: str = ""
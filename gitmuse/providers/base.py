@@ -12,9 +12,12 @@ class BaseProvider(ABC):
     Abstract base class for all AI providers.
     """
     @abstractmethod
-    def generate_commit_message(self, prompt: str) -> str:
+    def generate_commit_message(self, prompt: str, show_progress: bool = True) -> str:
         """
         Generate a commit message based on the given prompt.
+
+        show_progress is False when generating in the background, so the spinner
+        does not fight with interactive prompts for the terminal.
         """
         pass
 
@@ -48,7 +51,7 @@ class AIProvider(BaseProvider):
             yield progress
 
     @abstractmethod
-    def generate_commit_message(self, prompt: str) -> str:
+    def generate_commit_message(self, prompt: str, show_progress: bool = True) -> str:
         """
         Abstract method to generate a commit message.
         """
@@ -1,8 +1,8 @@
-from functools import lru_cache
-from typing import Optional, Any, Mapping
+import time
+from typing import Optional, Any, Mapping, Tuple
 from gitmuse.providers.base import AIProvider, OllamaConfig
 import ollama
-from gitmuse.utils.logging import get_logger
+from gitmuse.utils.logging import get_logger, print_console
 from gitmuse.config.settings import CONFIG
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -11,17 +11,31 @@ from ollama import Options
 logger = get_logger(__name__)
 console = Console()
 
-@lru_cache(maxsize=1)
+# Seconds a status probe is reused before the service is asked again
+OLLAMA_STATUS_TTL = 30.0
+
+_ollama_status: Optional[Tuple[float, Optional[Mapping[str, Any]]]] = None
+
 def get_ollama_status() -> Optional[Mapping[str, Any]]:
     """
-    Check the status of the Ollama service and cache the result.
+    Check the status of the Ollama service. A successful probe is reused for
+    OLLAMA_STATUS_TTL seconds, a failed one is retried on the next call so a
+    service started in the meantime is picked up.
     """
+    global _ollama_status
+    now = time.monotonic()
+    if _ollama_status is not None and now - _ollama_status[0] < OLLAMA_STATUS_TTL:
+        return _ollama_status[1]
+
+    status: Optional[Mapping[str, Any]]
     try:
-        return ollama.ps()
+        status = ollama.ps()
     except Exception as e:
         logger.error(f"Error checking Ollama status: {e}", exc_info=True)
-        console.print(f"[bold red]Error:[/bold red] Could not check Ollama status. Details: {e}")
-        return None
+        print_console(f"[bold red]Error:[/bold red] Could not check Ollama status. Details: {e}")
+        status = None
+    _ollama_status = (now, status) if status is not None else None
+    return status
 
 class OllamaProvider(AIProvider):
     """
@@ -39,7 +53,7 @@ class OllamaProvider(AIProvider):
     def status(self) -> bool:
         return self.check_ollama()
 
-    def generate_commit_message(self, prompt: str) -> str:
+    def generate_commit_message(self, prompt: str, show_progress: bool = True) -> str:
         """
         Generate a commit message using the Ollama service based on the given prompt.
         """
@@ -48,7 +62,7 @@ class OllamaProvider(AIProvider):
             return "📝 Update files\n\nOllama is not running or not accessible."
 
         logger.info("Generating commit message with Ollama")
-        progress = Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console)
+        progress = Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console, disable=not show_progress)
         with progress:
             task = progress.add_task("[cyan]Generating commit message...", total=None)
             try:
@@ -66,7 +80,7 @@ class OllamaProvider(AIProvider):
             except Exception as e:
                 progress.update(task, completed=True)
                 logger.error(f"Error generating commit message with Ollama: {e}", exc_info=True)
-                console.print(f"[bold red]Error:[/bold red] Failed to generate commit message. Details: {e}")
+                print_console(f"[bold red]Error:[/bold red] Failed to generate commit message. Details: {e}")
                 return "📝 Update files\n\nFailed to generate commit message due to an error."
 
     def get_generation_options(self) -> Options:
@@ -132,7 +146,7 @@ Generate a commit message for the following changes:
         ]
 
         final_message = "\n".join(cleaned_lines).strip()
-        logger.info(f"Processed Ollama response: {final_message}")
+        logger.debug(f"Processed Ollama response: {final_message}")
         return final_message
 
     @classmethod
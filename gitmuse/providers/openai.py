@@ -1,18 +1,25 @@
-import subprocess
+from functools import lru_cache
 from typing import Dict, Any, List
 from gitmuse.providers.base import AIProvider, AIProviderConfig
-from gitmuse.utils.logging import get_logger
+from gitmuse.utils.logging import get_logger, print_console
 from gitmuse.config.settings import CONFIG
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 import requests  # type: ignore
 import json
-import re
 
 logger = get_logger(__name__)
 console = Console()
 
 
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Get the HTTP session shared by all OpenAI requests so connections are reused.
+    """
+    return requests.Session()
+
+
 class OpenAIProvider(AIProvider):
     def __init__(self, config: AIProviderConfig):
         super().__init__(config)
@@ -21,7 +28,7 @@ class OpenAIProvider(AIProvider):
         self.url = "https://api.openai.com/v1/chat/completions"
         logger.info(f"Initialized OpenAIProvider with model {self.model}")
 
-    def generate_commit_message(self, prompt: str) -> str:
+    def generate_commit_message(self, prompt: str, show_progress: bool = True) -> str:
         """
         Generate a commit message using the OpenAI API based on the given prompt.
         """
@@ -30,7 +37,7 @@ class OpenAIProvider(AIProvider):
             return "📝 Update files\n\nOpenAI API key is not set."
 
         logger.info("Generating commit message with OpenAI")
-        progress = Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console)
+        progress = Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console, disable=not show_progress)
         with progress:
             task = progress.add_task("[cyan]Generating commit message...", total=None)
             try:
@@ -40,7 +47,7 @@ class OpenAIProvider(AIProvider):
             except Exception as e:
                 progress.update(task, completed=True)
                 logger.error(f"Error generating commit message with OpenAI: {e}", exc_info=True)
-                console.print(f"[bold red]Error:[/bold red] Failed to generate commit message. Details: {e}")
+                print_console(f"[bold red]Error:[/bold red] Failed to generate commit message. Details: {e}")
                 return "📝 Update files\n\nFailed to generate commit message due to an error."
 
     def make_api_request(self, prompt: str) -> Dict[str, Any]:
@@ -57,7 +64,7 @@ class OpenAIProvider(AIProvider):
             "temperature": self.config.temperature,
             "max_tokens": self.config.max_tokens,
         }
-        response = requests.post(self.url, headers=headers, json=data)
+        response = get_http_session().post(self.url, headers=headers, json=data)
         response.raise_for_status()
         return response.json()
 
@@ -66,9 +73,10 @@ class OpenAIProvider(AIProvider):
         Process the response from the OpenAI API.
         """
         content = response['choices'][0]['message']['content']
-        match = re.search(r'\{.*\}', content, re.DOTALL)
-        if match:
-            content = match.group()
+        # The outermost braces, as a greedy r'\{.*\}' search would match them
+        start, end = content.find('{'), content.rfind('}')
+        if start != -1 and end > start:
+            content = content[start:end + 1]
         else:
             raise ValueError("Unable to extract JSON content from the response")
         commit_data = json.loads(content)
@@ -96,14 +104,6 @@ class OpenAIProvider(AIProvider):
     def display_progress(self, message: str):
         return console.status(f"[bold green]{message}[/bold green]")
 
-def get_diff() -> str:
-    """Get the current git diff."""
-    return subprocess.check_output(['git', 'diff', '--staged']).decode('utf-8')
-
-def get_changed_files() -> List[str]:
-    """Get the list of changed files."""
-    return subprocess.check_output(['git', 'diff', '--staged', '--name-only']).decode('utf-8').splitlines()
-
 def generate_prompt(diff: str, changed_files: List[str]) -> str:
     """Generate the prompt for the OpenAI API."""
     files_summary = ", ".join(changed_files[:3])
@@ -163,11 +163,13 @@ if __name__ == "__main__":
     )
     provider = OpenAIProvider(config)
 
-    changed_files = get_changed_files()
+    from gitmuse.core.git_utils import get_full_diff, get_staged_files
+
+    changed_files = [file.file_path for file in get_staged_files()]
     if not changed_files:
         console.print("\n[bold red]🌚 No changes detected in the staging area.[/bold red]")
     else:
-        diff = get_diff()
+        diff = get_full_diff()
         prompt = generate_prompt(diff, changed_files)
         commit_message = provider.generate_commit_message(prompt)
         console.print(f"\n[bold green]Generated commit message:[/bold green]\n\n{commit_message}")
\ No newline at end of file
@@ -1,8 +1,11 @@
+import json
+import threading
+from contextlib import contextmanager
 import structlog
 from structlog.stdlib import LoggerFactory
 from structlog.processors import TimeStamper, StackInfoRenderer, format_exc_info
 from structlog.typing import Processor, EventDict
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 from rich.console import Console
 
 console = Console()
@@ -17,16 +20,65 @@ def get_json_output() -> Processor:
     return structlog.processors.JSONRenderer()
 
 def get_file_output(log_file: str) -> Processor:
-    return structlog.processors.JSONRenderer(file=open(log_file, "a"))
+    # The file is only opened once something is actually logged
+    log_handle: Optional[TextIO] = None
+
+    def file_writer(_, __, event_dict: EventDict) -> EventDict:
+        nonlocal log_handle
+        if log_handle is None:
+            log_handle = open(log_file, "a")
+        log_handle.write(json.dumps(event_dict, default=str) + "\n")
+        log_handle.flush()
+        return event_dict
+    return file_writer
+
+# Console output held back while defer_console_logs is active
+_deferred_output: Optional[List[Tuple[Callable[..., None], Tuple[Any, ...]]]] = None
+_deferred_lock = threading.Lock()
+
+def _emit(printer: Callable[..., None], *args: Any) -> None:
+    with _deferred_lock:
+        if _deferred_output is not None:
+            _deferred_output.append((printer, args))
+            return
+    printer(*args)
+
+def _print_event(level: str, message: Any, extra: Dict[str, Any]) -> None:
+    console.print(f"[bold]{level}[/bold]: {message}")
+    if extra:
+        console.print(extra, style="dim")
+
+def print_console(*objects: Any) -> None:
+    """
+    Print to the console like console.print, but held back by defer_console_logs.
+    Used for messages printed from code that may run in a background thread.
+    """
+    _emit(console.print, *objects)
+
+@contextmanager
+def defer_console_logs() -> Iterator[None]:
+    """
+    Hold back console log output and print_console messages, including from
+    other threads, until the block exits. Used while a prompt owns the terminal
+    so they can't interleave with it.
+    """
+    global _deferred_output
+    with _deferred_lock:
+        _deferred_output = []
+    try:
+        yield
+    finally:
+        with _deferred_lock:
+            held, _deferred_output = _deferred_output, None
+        for printer, args in held:
+            printer(*args)
 
 def get_rich_console_output() -> Processor:
     def rich_renderer(_, __, event_dict: EventDict) -> str:
         level = event_dict.get("level", "info").upper()
         message = event_dict.get("event", "")
         extra = {k: v for k, v in event_dict.items() if k not in {"level", "event", "timestamp"}}
-        console.print(f"[bold]{level}[/bold]: {message}")
-        if extra:
-            console.print(extra, style="dim")
+        _emit(_print_event, level, message, extra)
         return ""
     return rich_renderer
 
@@ -47,14 +99,15 @@ def configure_logging(
         structlog.processors.UnicodeDecoder(),
     ]
 
+    # Runs before the renderer below, which turns the event into a string
+    if log_file:
+        processors.append(get_file_output(log_file))
+
     if log_format == "console":
         processors.append(get_rich_console_output() if use_rich else get_console_output())
     elif log_format == "json":
         processors.append(get_json_output())
 
-    if log_file:
-        processors.append(get_file_output(log_file))
-
     structlog.configure(
         processors=processors,
         context_class=dict,
@@ -0,0 +1,36 @@
+import subprocess
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from gitmuse.core.git_utils import clear_git_caches
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """An empty git repository with an initial commit, used as the working directory."""
+    for command in (
+        ["git", "init", "-q"],
+        ["git", "config", "user.name", "GitMuse Tests"],
+        ["git", "config", "user.email", "tests@example.com"],
+        ["git", "config", "commit.gpgsign", "false"],
+        ["git", "commit", "-q", "--allow-empty", "-m", "Initial commit"],
+    ):
+        subprocess.run(command, cwd=tmp_path, check=True, capture_output=True)
+    monkeypatch.chdir(tmp_path)
+    clear_git_caches()
+    yield tmp_path
+    clear_git_caches()
+
+
+@pytest.fixture
+def git(git_repo: Path) -> Callable[..., str]:
+    """Run a git command in the test repository and return its output."""
+
+    def run(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=git_repo, check=True, capture_output=True, text=True
+        ).stdout
+
+    return run
@@ -0,0 +1,154 @@
+import pytest
+from rich.prompt import Prompt
+
+from gitmuse.cli import commands
+from gitmuse.core import message_generator
+from gitmuse.core.git_utils import get_gitignore_patterns, get_ignore_matcher, get_staged_files
+from gitmuse.models import DiffStat
+
+
+@pytest.mark.parametrize(
+    "diff_stat, expected",
+    [
+        (DiffStat(files_changed=50, insertions=10000, deletions=10000), False),
+        (DiffStat(files_changed=51, insertions=1, deletions=0), True),
+        (DiffStat(files_changed=1, insertions=20001, deletions=0), True),
+        (DiffStat(files_changed=1, insertions=10000, deletions=10001), True),
+        (DiffStat(), False),
+    ],
+)
+def test_is_large_diff_thresholds(diff_stat, expected):
+    assert commands.is_large_diff(diff_stat) is expected
+
+
+@pytest.fixture
+def staged_changes(git_repo, git):
+    (git_repo / "old.txt").write_text("moved\n")
+    (git_repo / "keep.py").write_text("a = 1\n")
+    git("add", "-A")
+    git("commit", "-q", "-m", "Add files")
+    git("mv", "old.txt", "new.txt")
+    (git_repo / "keep.py").write_text("a = 2\n")
+    (git_repo / "added.py").write_text("print('secret body')\n")
+    git("add", "-A")
+    return git_repo
+
+
+def test_summary_lists_files_without_their_contents(staged_changes):
+    _, _, diff = commands.get_commit_files(
+        get_staged_files(), get_ignore_matcher(frozenset()), full_diff=False
+    )
+
+    assert "diff --git a/added.py b/added.py\nnew file mode\n" in diff
+    assert "diff --git a/old.txt b/new.txt\nrename from\n" in diff
+    assert "diff --git a/keep.py b/keep.py\nindex\n" in diff
+    assert "secret body" not in diff and "@@" not in diff
+
+
+@pytest.fixture
+def sent_diffs(monkeypatch):
+    """Record the diff commit_command sends for generation and abort afterwards."""
+    diffs = []
+
+    def generate(diff, **kwargs):
+        diffs.append(diff)
+        return "✨ feat: add files"
+
+    monkeypatch.setattr(message_generator, "generate_commit_message", generate)
+    monkeypatch.setattr(Prompt, "ask", classmethod(lambda cls, *args, **kwargs: "a"))
+    return diffs
+
+
+def test_large_changeset_sends_a_summary(staged_changes, sent_diffs, monkeypatch):
+    monkeypatch.setattr(commands, "LARGE_DIFF_MAX_FILES", 2)
+
+    commands.commit_command("ollama")
+
+    assert "secret body" not in sent_diffs[0]
+    assert "diff --git a/added.py b/added.py\nnew file mode\n" in sent_diffs[0]
+
+
+def test_force_full_diff_sends_the_full_diff(staged_changes, sent_diffs, monkeypatch):
+    monkeypatch.setattr(commands, "LARGE_DIFF_MAX_FILES", 2)
+
+    commands.commit_command("ollama", force_full_diff=True)
+
+    assert "+print('secret body')" in sent_diffs[0]
+
+
+def test_small_changeset_sends_the_full_diff(staged_changes, sent_diffs):
+    commands.commit_command("ollama")
+
+    assert "+print('secret body')" in sent_diffs[0]
+
+
+@pytest.fixture
+def commit_flow(staged_changes, monkeypatch):
+    """Answer the action prompt with scripted input and record what gets committed."""
+    answers = []
+    committed = []
+    monkeypatch.setattr(
+        message_generator, "generate_commit_message", lambda diff, **kwargs: "✨ feat: add files"
+    )
+    monkeypatch.setattr(
+        Prompt, "get_input", classmethod(lambda cls, *args, **kwargs: answers.pop(0))
+    )
+    monkeypatch.setattr(commands, "edit_commit_message", lambda message: "📝 docs: edited")
+    monkeypatch.setattr(
+        commands, "perform_commit", lambda message, confirm=True: committed.append(message) or True
+    )
+    return answers, committed
+
+
+def test_commit_uses_the_generated_message(commit_flow):
+    answers, committed = commit_flow
+    answers.extend(["c"])
+
+    commands.commit_command("ollama")
+
+    assert committed == ["✨ feat: add files"]
+
+
+def test_edit_asks_again_before_committing(commit_flow):
+    answers, committed = commit_flow
+    answers.extend(["e", "c"])
+
+    commands.commit_command("ollama")
+
+    assert committed == ["📝 docs: edited"]
+    assert answers == []
+
+
+def test_abort_does_not_commit(commit_flow, capsys):
+    answers, committed = commit_flow
+    answers.extend(["a"])
+
+    commands.commit_command("ollama")
+
+    assert committed == []
+    assert "Commit cancelled" in capsys.readouterr().out
+
+
+def test_invalid_answer_is_asked_again(commit_flow):
+    answers, committed = commit_flow
+    answers.extend(["x", "commit", "c"])
+
+    commands.commit_command("ollama")
+
+    assert committed == ["✨ feat: add files"]
+    assert answers == []
+
+
+def test_staged_files_matching_gitignore_are_left_out(git_repo, git):
+    (git_repo / ".gitignore").write_text("*.lock\n")
+    (git_repo / "poetry.lock").write_text("[[package]]\n")
+    (git_repo / "app.py").write_text("print('hello')\n")
+    git("add", "-f", "poetry.lock")
+    git("add", "app.py", ".gitignore")
+    matcher = get_ignore_matcher(frozenset(get_gitignore_patterns()))
+
+    files, ignored_files, diff = commands.get_commit_files(get_staged_files(), matcher)
+
+    assert [file.file_path for file in ignored_files] == ["poetry.lock"]
+    assert "poetry.lock" not in [file.file_path for file in files]
+    assert "[[package]]" not in diff and "+print('hello')" in diff
@@ -0,0 +1,75 @@
+from gitmuse.core.diff_analyzer import GitDiffAnalyzer
+from gitmuse.core.git_utils import get_staged_files
+
+
+def _analyze_staged():
+    analyzer = GitDiffAnalyzer(set(), get_staged_files())
+    diff, _ = analyzer.get_diff()
+    analysis = analyzer.analyze_diff(diff)
+    return {status: [change["file"] for change in changes] for status, changes in analysis.items()}
+
+
+def test_get_diff_keeps_renamed_and_quoted_paths(git_repo, git):
+    (git_repo / "old.txt").write_text("unchanged\n")
+    (git_repo / "ünï.txt").write_text("before\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "Add files")
+    git("mv", "old.txt", "new.txt")
+    (git_repo / "ünï.txt").write_text("before\nafter\n")
+    (git_repo / 'quo"te.txt').write_text("new\n")
+    git("add", "-A")
+
+    files = _analyze_staged()
+
+    assert files["renamed"] == ["new.txt"]
+    assert sorted(files["modified"]) == ["ünï.txt"]
+    assert files["added"] == ['quo"te.txt']
+
+
+def _commit_all(git, message="Update"):
+    git("add", "-A")
+    git("commit", "-q", "-m", message)
+
+
+def test_analyze_diff_sections_without_hunks(git_repo, git):
+    script = git_repo / "mode.sh"
+    script.write_text("echo hi\n")
+    (git_repo / "image.bin").write_bytes(b"\x00\x01\x02")
+    (git_repo / "moved.txt").write_text("same content\n")
+    (git_repo / "sp ace.txt").write_text("one\n")
+    _commit_all(git, "Add files")
+
+    script.chmod(0o755)
+    (git_repo / "image.bin").write_bytes(b"\x00\x03\x04")
+    git("mv", "moved.txt", "renamed.txt")
+    (git_repo / "sp ace.txt").write_text("one\ntwo\n")
+    git("add", "-A")
+
+    analyzer = GitDiffAnalyzer(set(), get_staged_files())
+    diff, _ = analyzer.get_diff()
+    analysis = analyzer.analyze_diff(diff)
+    contents = {
+        change["file"]: change["content"]
+        for changes in analysis.values()
+        for change in changes
+    }
+
+    assert contents["mode.sh"] == "old mode 100644\nnew mode 100755"
+    assert contents["image.bin"] == "Binary files a/image.bin and b/image.bin differ"
+    assert [change["file"] for change in analysis["renamed"]] == ["renamed.txt"]
+    assert contents["renamed.txt"] == "similarity index 100%\nrename to renamed.txt"
+    assert "+two" in contents["sp ace.txt"]
+    for content in contents.values():
+        assert "File: " not in content and "Status: " not in content
+
+
+def test_staged_lock_file_is_ignored(git_repo, git):
+    (git_repo / "poetry.lock").write_text("[[package]]\n")
+    (git_repo / "app.py").write_text("print('hello')\n")
+    git("add", "-A")
+
+    analyzer = GitDiffAnalyzer(set(), get_staged_files())
+    diff, ignored_files = analyzer.get_diff()
+
+    assert ignored_files == ["poetry.lock"]
+    assert "File: app.py" in diff and "poetry.lock" not in diff
@@ -0,0 +1,199 @@
+import fnmatch
+import os
+
+import pytest
+
+from gitmuse.core import git_utils
+from gitmuse.core.git_utils import (
+    IgnoreMatcher,
+    _load_staged_summary,
+    check_staging_area,
+    clear_git_caches,
+    get_diff_batch,
+    get_gitignore_patterns,
+    get_diff_stat,
+    iter_diff_batch,
+    parse_diff_header,
+    unquote_path,
+)
+from gitmuse.models import DiffStat, StagedFile
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("diff --git a/app.py b/app.py", "app.py"),
+        ("diff --git a/src/a b/c.txt b/src/a b/c.txt", "src/a b/c.txt"),
+        ("diff --git a/old.txt b/new.txt", "new.txt"),
+        ('diff --git "a/\\303\\274n\\303\\257.txt" "b/\\303\\274n\\303\\257.txt"', "ünï.txt"),
+        ('diff --git a/plain.txt "b/quo\\"te.txt"', 'quo"te.txt'),
+        ('diff --git "a/quo\\" b/te.txt" b/plain.txt', "plain.txt"),
+    ],
+)
+def test_parse_diff_header(header, expected):
+    assert parse_diff_header(header) == expected
+
+
+def test_unquote_path():
+    assert unquote_path("plain.txt") == "plain.txt"
+    assert unquote_path('"tab\\there"') == "tab\there"
+    assert unquote_path('"back\\\\slash"') == "back\\slash"
+    assert unquote_path('"\\303\\266.txt"') == "ö.txt"
+
+
+def test_iter_diff_batch_splits_per_file(git_repo, git):
+    (git_repo / "a b").mkdir()
+    (git_repo / "a b" / "c.txt").write_text("one\n")
+    (git_repo / "old.txt").write_text("moved\n")
+    git("add", "-A")
+    git("commit", "-q", "-m", "Add files")
+    (git_repo / "a b" / "c.txt").write_text("one\ntwo\n")
+    git("mv", "old.txt", "new.txt")
+    (git_repo / "ünï.txt").write_text("new\n")
+    git("add", "-A")
+
+    batch = dict(iter_diff_batch())
+
+    assert sorted(batch) == ["a b/c.txt", "new.txt", "ünï.txt"]
+    assert batch["a b/c.txt"] == git("diff", "--cached", "--unified=10", "--", "a b/c.txt")
+    assert "rename to new.txt" in batch["new.txt"]
+    assert batch["ünï.txt"].endswith("+new\n")
+    assert all(diff.startswith("diff --git ") for diff in batch.values())
+
+
+def test_iter_diff_batch_without_staged_changes(git_repo):
+    assert list(iter_diff_batch()) == []
+
+
+def test_staged_summary_lists_files_and_totals(git_repo, git):
+    (git_repo / "keep.txt").write_text("a\nb\n")
+    (git_repo / "gone.txt").write_text("bye\n")
+    (git_repo / "old.txt").write_text("moved\n")
+    git("add", "-A")
+    git("commit", "-q", "-m", "Add files")
+    (git_repo / "keep.txt").write_text("a\nc\n")
+    git("rm", "-q", "gone.txt")
+    git("mv", "old.txt", "new.txt")
+    (git_repo / "sp ace ü.txt").write_text("new\n")
+    git("add", "-A")
+
+    staged_files, diff_stat = _load_staged_summary()
+
+    assert sorted(staged_files, key=lambda file: file.file_path) == [
+        StagedFile(status="D", file_path="gone.txt"),
+        StagedFile(status="M", file_path="keep.txt"),
+        StagedFile(status="R100", file_path="old.txt\tnew.txt"),
+        StagedFile(status="A", file_path="sp ace ü.txt"),
+    ]
+    assert diff_stat == DiffStat(files_changed=4, insertions=2, deletions=2)
+    assert check_staging_area()
+    assert get_diff_stat() == diff_stat
+
+
+def test_staged_summary_with_nothing_staged(git_repo):
+    assert _load_staged_summary() == ([], DiffStat())
+    assert not check_staging_area()
+
+
+def _reference_matches(path, pattern):
+    candidates = [pattern[1:], pattern] if pattern.startswith("/") else [pattern]
+    return any(fnmatch.fnmatch(path, candidate) for candidate in candidates) or (
+        fnmatch.fnmatch(os.path.basename(path), pattern)
+    )
+
+
+IGNORE_PATTERNS = {"*.pyc", "/build", "node_modules", "docs/*.md", "[ab]?.log", ".env"}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "main.py",
+        "pkg/cache.pyc",
+        "build",
+        "src/build",
+        "node_modules",
+        "web/node_modules",
+        "docs/index.md",
+        "docs/api/index.md",
+        "README.md",
+        "a1.log",
+        "logs/b2.log",
+        "c1.log",
+        ".env",
+        "config/.env.example",
+    ],
+)
+def test_ignore_matcher_agrees_with_per_pattern_fnmatch(path):
+    matched = IgnoreMatcher(IGNORE_PATTERNS).match(path)
+    expected = {pattern for pattern in IGNORE_PATTERNS if _reference_matches(path, pattern)}
+
+    if expected:
+        assert matched in expected
+    else:
+        assert matched is None
+
+
+def test_ignore_matcher_without_patterns_matches_nothing():
+    matcher = IgnoreMatcher(set())
+
+    assert matcher.match("anything.txt") is None
+    assert matcher.match("") is None
+
+
+def test_gitignore_patterns_are_read_from_the_repo_root(git_repo, git, monkeypatch):
+    (git_repo / ".gitignore").write_text("*.log\n# comment\n")
+    (git_repo / "src" / "pkg").mkdir(parents=True)
+    (git_repo / "src" / ".gitignore").write_text("*.tmp\n")
+    (git_repo / "other").mkdir()
+    (git_repo / "other" / ".gitignore").write_text("*.bak\n")
+    (git_repo / "src" / "pkg" / "module.py").write_text("pass\n")
+    git("add", "src/pkg/module.py")
+    monkeypatch.chdir(git_repo / "src" / "pkg")
+
+    assert get_gitignore_patterns() == {"*.log", "*.tmp"}
+
+
+def test_staging_check_is_cached_until_cleared(git_repo, git):
+    assert not check_staging_area()
+    (git_repo / "app.py").write_text("print('hello')\n")
+    git("add", "app.py")
+
+    assert not check_staging_area()
+    clear_git_caches()
+    assert check_staging_area()
+
+
+def test_staging_check_outside_a_repository_raises(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    clear_git_caches()
+
+    with pytest.raises(RuntimeError, match="Could not read the staged changes"):
+        check_staging_area()
+
+
+def test_per_file_diff_from_a_subdirectory(git_repo, git, monkeypatch):
+    (git_repo / "src").mkdir()
+    (git_repo / "src" / "app[1].py").write_text("a = 1\n")
+    git("add", "-A")
+    git("commit", "-q", "-m", "Add app")
+    (git_repo / "src" / "app[1].py").write_text("a = 2\n")
+    git("add", "-A")
+    monkeypatch.chdir(git_repo / "src")
+    # Skip the batch so the per-file fallback runs
+    monkeypatch.setattr(git_utils, "iter_diff_batch", lambda: iter(()))
+
+    diff = git_utils.get_diff("src/app[1].py")
+
+    assert diff.startswith("diff --git a/src/app[1].py b/src/app[1].py\n")
+    assert "+a = 2" in diff
+
+
+@pytest.mark.parametrize("setting", ["diff.noprefix", "diff.mnemonicPrefix"])
+def test_diff_batch_ignores_prefix_settings(git_repo, git, setting):
+    git("config", setting, "true")
+    (git_repo / "app.py").write_text("print('hello')\n")
+    git("add", "app.py")
+
+    assert list(get_diff_batch()) == ["app.py"]
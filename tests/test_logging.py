@@ -0,0 +1,45 @@
+import threading
+
+from gitmuse.utils.logging import configure_logging, defer_console_logs, get_logger
+
+
+def test_defer_console_logs_holds_output_from_other_threads(capsys):
+    configure_logging(log_level="INFO", log_format="console", use_rich=True)
+    logger = get_logger("tests.deferred")
+
+    with defer_console_logs():
+        worker = threading.Thread(target=logger.warning, args=("from the worker",))
+        worker.start()
+        worker.join()
+        assert "from the worker" not in capsys.readouterr().out
+
+    assert "from the worker" in capsys.readouterr().out
+
+
+def test_console_logs_print_immediately_outside_the_block(capsys):
+    configure_logging(log_level="INFO", log_format="console", use_rich=True)
+    get_logger("tests.immediate").warning("right away")
+
+    assert "right away" in capsys.readouterr().out
+
+
+def test_provider_errors_from_a_worker_print_after_the_block(capsys, monkeypatch):
+    from gitmuse.cli.ui import console
+    from gitmuse.providers import ollama
+
+    def unreachable():
+        raise ConnectionError("connection refused")
+
+    monkeypatch.setattr(ollama.ollama, "ps", unreachable)
+    monkeypatch.setattr(ollama, "_ollama_status", None)
+    configure_logging(log_level="INFO", log_format="console", use_rich=True)
+
+    with defer_console_logs():
+        worker = threading.Thread(target=ollama.get_ollama_status)
+        worker.start()
+        worker.join()
+        console.print("diff view")
+
+    output = capsys.readouterr().out
+    assert "diff view" in output
+    assert output.index("diff view") < output.index("Could not check Ollama status")
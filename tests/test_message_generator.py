@@ -0,0 +1,104 @@
+import pytest
+
+from gitmuse.core import message_generator
+from gitmuse.core.message_generator import Changes, create_prompt_content, parse_template
+from gitmuse.providers.base import AIProviderConfig
+from gitmuse.providers.ollama import OllamaProvider
+
+SAMPLE_DIFF = (
+    "diff --git a/app.py b/app.py\n"
+    "new file mode 100644\n"
+    "--- /dev/null\n"
+    "+++ b/app.py\n"
+    "@@ -0,0 +1 @@\n"
+    "+print('hello')\n"
+)
+
+
+class RecordingProvider:
+    model = "test-model"
+    config = AIProviderConfig(model="test-model")
+
+    def __init__(self):
+        self.calls = []
+
+    def generate_commit_message(self, prompt, show_progress=True):
+        self.calls.append(show_progress)
+        return '{"title": "✨ feat: add app", "body": {}, "summary": "Adds the app."}'
+
+
+def test_show_progress_is_passed_per_call(monkeypatch):
+    provider = RecordingProvider()
+    monkeypatch.setattr(message_generator, "get_provider", lambda provider_name=None: provider)
+    monkeypatch.setenv("GITMUSE_DISABLE_PROMPT_CACHE", "1")
+
+    message_generator.generate_commit_message(SAMPLE_DIFF, show_progress=False)
+    message_generator.generate_commit_message(SAMPLE_DIFF)
+
+    assert provider.calls == [False, True]
+    assert not hasattr(provider, "show_progress")
+
+
+def test_cached_response_is_reused_unless_disabled(monkeypatch, tmp_path):
+    provider = RecordingProvider()
+    monkeypatch.setattr(message_generator, "get_provider", lambda provider_name=None: provider)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("GITMUSE_DISABLE_PROMPT_CACHE", raising=False)
+
+    first = message_generator.generate_commit_message(SAMPLE_DIFF)
+    second = message_generator.generate_commit_message(SAMPLE_DIFF)
+    message_generator.generate_commit_message(SAMPLE_DIFF, use_cache=False)
+
+    assert first == second
+    assert len(provider.calls) == 2
+
+
+CHANGES = Changes(
+    files_summary="app.py",
+    changes_summary="Added 1 file",
+    detailed_changes=["Added app.py", "Modified {braces}.py"],
+)
+
+
+def _format_values():
+    return {
+        "files_summary": CHANGES.files_summary,
+        "changes_summary": CHANGES.changes_summary,
+        "detailed_changes": "\n".join(CHANGES.detailed_changes),
+        "keywords": message_generator.get_commit_type_keywords(),
+    }
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        message_generator.load_default_template(),
+        OllamaProvider.format_prompt_for_llama(message_generator.load_default_template()),
+        "Files: {files_summary}\n{detailed_changes}",
+        "{{literal}} {changes_summary} }}",
+        "no fields at all",
+        "",
+    ],
+)
+def test_parsed_template_renders_like_str_format(template):
+    assert parse_template(template) is not None
+    assert create_prompt_content(CHANGES, False, template) == template.format(**_format_values())
+
+
+@pytest.mark.parametrize(
+    "template",
+    ["{files_summary!r}", "{changes_summary:>40}", "{0}", "{}", "{values[key]}", "{a.b}"],
+)
+def test_templates_beyond_named_fields_fall_back_to_str_format(template):
+    assert parse_template(template) is None
+
+
+def test_fallback_template_is_still_formatted():
+    template = "{files_summary!r} {changes_summary:>15}"
+
+    assert create_prompt_content(CHANGES, False, template) == template.format(**_format_values())
+
+
+def test_unknown_field_raises_key_error():
+    with pytest.raises(KeyError):
+        create_prompt_content(CHANGES, False, "{unknown_field}")
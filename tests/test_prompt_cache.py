@@ -0,0 +1,90 @@
+import os
+import time
+
+import pytest
+
+from gitmuse.core import prompt_cache
+from gitmuse.core.prompt_cache import get_cache_dir, get_cache_key, get_cached_response, store_response
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("GITMUSE_DISABLE_PROMPT_CACHE", raising=False)
+    return tmp_path
+
+
+def _key(prompt="prompt", temperature=0.7, max_tokens=300):
+    return get_cache_key("OllamaProvider", "llama3", prompt, temperature, max_tokens)
+
+
+def test_cache_dir_follows_xdg_cache_home(cache_home):
+    assert get_cache_dir() == cache_home / "gitmuse" / "prompts"
+
+
+def test_stored_response_is_a_hit():
+    store_response(_key(), '{"title": "feat: cached"}')
+
+    assert get_cached_response(_key()) == '{"title": "feat: cached"}'
+
+
+def test_unknown_key_is_a_miss():
+    store_response(_key(), "response")
+
+    assert get_cached_response(_key("other prompt")) is None
+
+
+def test_key_depends_on_every_part():
+    keys = {
+        _key(),
+        _key("other prompt"),
+        _key(temperature=0.2),
+        _key(max_tokens=500),
+        get_cache_key("OpenAIProvider", "llama3", "prompt", 0.7, 300),
+        get_cache_key("OllamaProvider", "mistral", "prompt", 0.7, 300),
+    }
+
+    assert len(keys) == 6
+    assert get_cache_key("a", "bc", "", 0.7, 300) != get_cache_key("ab", "c", "", 0.7, 300)
+
+
+def test_disabled_cache_neither_reads_nor_writes(monkeypatch):
+    store_response(_key(), "kept")
+    monkeypatch.setenv("GITMUSE_DISABLE_PROMPT_CACHE", "1")
+
+    store_response(_key("new prompt"), "dropped")
+
+    assert get_cached_response(_key()) is None
+    monkeypatch.delenv("GITMUSE_DISABLE_PROMPT_CACHE")
+    assert get_cached_response(_key("new prompt")) is None
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]", '{"response": 42}', ""])
+def test_corrupt_entry_is_a_miss(content):
+    get_cache_dir().mkdir(parents=True)
+    (get_cache_dir() / f"{_key()}.json").write_text(content)
+
+    assert get_cached_response(_key()) is None
+
+
+def test_expired_entry_is_a_miss():
+    store_response(_key(), "stale")
+    expired = time.time() - prompt_cache.MAX_CACHE_AGE - 60
+    os.utime(get_cache_dir() / f"{_key()}.json", (expired, expired))
+
+    assert get_cached_response(_key()) is None
+
+
+def test_store_keeps_only_the_newest_entries(monkeypatch):
+    monkeypatch.setattr(prompt_cache, "MAX_CACHE_ENTRIES", 3)
+    now = time.time()
+    for age, prompt in enumerate(["newest", "newer", "older", "oldest"]):
+        store_response(_key(prompt), prompt)
+        path = get_cache_dir() / f"{_key(prompt)}.json"
+        os.utime(path, (now - 10 * (age + 1), now - 10 * (age + 1)))
+
+    store_response(_key("latest"), "latest")
+
+    assert sorted(path.name for path in get_cache_dir().iterdir()) == sorted(
+        f"{_key(prompt)}.json" for prompt in ["latest", "newest", "newer"]
+    )
@@ -0,0 +1,19 @@
+from gitmuse.providers import ollama as ollama_provider
+
+
+def test_failed_ollama_probe_is_retried(monkeypatch):
+    responses = [RuntimeError("connection refused"), {"models": []}]
+
+    def ps():
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(ollama_provider.ollama, "ps", ps)
+    monkeypatch.setattr(ollama_provider, "_ollama_status", None)
+
+    assert ollama_provider.get_ollama_status() is None
+    assert ollama_provider.get_ollama_status() == {"models": []}
+    # A successful probe is reused
+    assert ollama_provider.get_ollama_status() == {"models": []}
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from gitmuse.config import settings
+from gitmuse.config.settings import CONFIG, DEFAULT_CONFIG, Config, ConfigError, _deep_merge
+
+
+def test_deep_merge_keeps_nested_defaults():
+    base = {"ai": {"provider": "ollama", "ollama": {"model": "llama3", "url": "local"}}, "version": 1}
+    overlay = {"ai": {"ollama": {"model": "mistral"}}}
+
+    merged = _deep_merge(base, overlay)
+
+    assert merged == {
+        "ai": {"provider": "ollama", "ollama": {"model": "mistral", "url": "local"}},
+        "version": 1,
+    }
+    assert base["ai"]["ollama"]["model"] == "llama3"
+
+
+def test_deep_merge_overlay_wins_for_non_dict_values():
+    assert _deep_merge({"a": {"b": 1}}, {"a": [1, 2]}) == {"a": [1, 2]}
+    assert _deep_merge({"a": 1}, {"a": {"b": 2}}) == {"a": {"b": 2}}
+    assert _deep_merge({"a": 1}, {"c": 3}) == {"a": 1, "c": 3}
+
+
+def test_deep_merge_with_empty_overlay_restates_defaults():
+    merged = _deep_merge(DEFAULT_CONFIG, {})
+
+    assert merged == DEFAULT_CONFIG
+    assert merged is not DEFAULT_CONFIG
+
+
+def _write_config(directory, config):
+    (directory / "gitmuse.json").write_text(json.dumps(config))
+
+
+def test_config_with_null_log_file_loads(tmp_path, monkeypatch):
+    _write_config(tmp_path, {"logging": {"file": None}})
+    monkeypatch.chdir(tmp_path)
+
+    assert CONFIG.load_config().logging.file is None
+
+
+# Valid for the models, but not one of the styles the schema allows
+INVALID_STYLE = {"commit": {"style": "shouty"}}
+
+
+def test_config_restating_defaults_skips_validation(tmp_path, monkeypatch):
+    _write_config(tmp_path, DEFAULT_CONFIG)
+    monkeypatch.chdir(tmp_path)
+    validated = []
+    monkeypatch.setattr(Config, "validate_config", lambda self, config: validated.append(config))
+
+    CONFIG.load_config()
+
+    assert validated == []
+
+
+def test_invalid_config_still_raises(tmp_path, monkeypatch):
+    _write_config(tmp_path, INVALID_STYLE)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITMUSE_SKIP_SCHEMA_VALIDATION", raising=False)
+
+    with pytest.raises(ConfigError, match="shouty"):
+        CONFIG.load_config()
+
+
+@pytest.mark.parametrize("value", ["1", "true", "YES"])
+def test_skip_schema_validation_env_var_bypasses_validation(tmp_path, monkeypatch, value):
+    _write_config(tmp_path, INVALID_STYLE)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GITMUSE_SKIP_SCHEMA_VALIDATION", value)
+
+    assert CONFIG.load_config().commit.style == "shouty"
+
+
+def test_find_repository_root_skips_unreadable_ancestors(tmp_path, monkeypatch):
+    (tmp_path / ".git").mkdir()
+    start = tmp_path / "locked" / "work"
+    start.mkdir(parents=True)
+    real_stat = settings.os.stat
+
+    def stat(path, *args, **kwargs):
+        if str(path).startswith(str(tmp_path / "locked")):
+            raise PermissionError(13, "Permission denied", path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(settings.os, "stat", stat)
+    settings.find_repository_root.cache_clear()
+
+    assert settings.find_repository_root(start) == tmp_path
+    settings.find_repository_root.cache_clear()
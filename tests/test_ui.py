@@ -0,0 +1,49 @@
+import pytest
+from rich.progress import Progress
+
+from gitmuse.cli.ui import perform_commit
+
+
+@pytest.fixture
+def staged_file(git_repo, git):
+    (git_repo / "app.py").write_text("print('hello')\n")
+    git("add", "app.py")
+
+
+def _install_hook(git_repo, script):
+    hook = git_repo / ".git" / "hooks" / "pre-commit"
+    hook.write_text(f"#!/bin/sh\n{script}\n")
+    hook.chmod(0o755)
+
+
+def test_perform_commit_creates_the_commit(staged_file, git, capsys):
+    assert perform_commit("✨ feat: add app", confirm=False)
+
+    assert git("log", "-1", "--format=%s").strip() == "✨ feat: add app"
+    assert "Commit successfully created" in capsys.readouterr().out
+
+
+def test_rejected_commit_is_reported_as_a_failure(staged_file, git_repo, git, capsys):
+    _install_hook(git_repo, "echo 'lint failed'\nexit 1")
+
+    assert not perform_commit("✨ feat: add app", confirm=False)
+
+    output = capsys.readouterr().out
+    assert "Git commit failed" in output and "lint failed" in output
+    assert "successfully" not in output
+    assert git("log", "-1", "--format=%s").strip() == "Initial commit"
+
+
+def test_commit_output_is_streamed_to_the_spinner(staged_file, git_repo, monkeypatch):
+    _install_hook(git_repo, "echo 'running checks'")
+    descriptions = []
+    update = Progress.update
+
+    def record(self, task_id, **kwargs):
+        descriptions.append(kwargs.get("description"))
+        update(self, task_id, **kwargs)
+
+    monkeypatch.setattr(Progress, "update", record)
+
+    assert perform_commit("✨ feat: add app", confirm=False)
+    assert "[cyan]running checks" in descriptions